@@ -1,9 +1,9 @@
 import typer
-import re
 from typing import Optional
+from sqlalchemy.orm import selectinload
 from .config import load_config, save_config, Config, ensure_config_dir
 from .models import init_db, SessionLocal, Repo, Issue
-from .sync import sync_repo_issues
+from .sync import sync_repo_issues, GITHUB_URL_RE
 from .github_client import GitHubClient
 from .devin_client import DevinClient
 
@@ -59,8 +59,8 @@ def setup():
     
     # 1. Verify GitHub
     try:
-        gh = GitHubClient(config)
-        user = gh.verify_auth()
+        with GitHubClient(config) as gh:
+            user = gh.verify_auth()
         print_success(f"GitHub Connected: {user}")
     except Exception as e:
         print_error(f"GitHub Verification Failed: {e}")
@@ -88,13 +88,12 @@ def connect(url: str):
         raise typer.Exit(code=1)
 
     # Regex to parse owner/repo
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", url)
+    match = GITHUB_URL_RE.search(url)
     if not match:
         print_error("Invalid GitHub URL. Must contain 'github.com/owner/repo'.")
         raise typer.Exit(code=1)
 
     owner, repo_name = match.groups()
-    repo_name = repo_name.replace(".git", "") # Clean .git extension
 
     db = get_db()
     try:
@@ -182,7 +181,11 @@ def remove(repo_name: str):
     """
     db = get_db()
     try:
-        repo = db.query(Repo).filter(Repo.name == repo_name).first()
+        # The delete cascades through issues and their sessions, so load both
+        # levels up front: two extra SELECTs instead of one per issue
+        repo = db.query(Repo).options(
+            selectinload(Repo.issues).selectinload(Issue.sessions)
+        ).filter(Repo.name == repo_name).first()
         if not repo:
             print_error(f"Repository '{repo_name}' not found.")
             return
@@ -192,8 +195,6 @@ def remove(repo_name: str):
             typer.echo("Aborted.")
             return
 
-        # Cascade delete (SQLAlchemy usually handles this, but let's be explicit if needed)
-        db.query(Issue).filter(Issue.repo_id == repo.id).delete()
         db.delete(repo)
         db.commit()
         
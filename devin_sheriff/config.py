@@ -2,13 +2,15 @@ import json
 import os
 import shutil
 import logging
+import functools
 from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel, Field
 
 # --- LOGGING SETUP ---
 # Simple logger to help debug config issues without cluttering stdout too much
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# LOG_LEVEL (e.g. DEBUG, WARNING) overrides the default INFO level
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(levelname)s: %(message)s')
 logger = logging.getLogger("config")
 
 # 1. Define Paths
@@ -68,6 +70,26 @@ def load_config() -> AppConfig:
 
     return config
 
+@functools.lru_cache(maxsize=1)
+def _load_config_for(mtime_ns: int, env_gh: Optional[str], env_devin: Optional[str]) -> AppConfig:
+    return load_config()
+
+def get_cached_config() -> AppConfig:
+    """
+    load_config(), reused until config.json changes (by mtime) or the env
+    overrides do, so hot paths pay one stat() instead of a read and parse.
+    Shared instance: treat as read-only and use load_config() to edit.
+    """
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = 0
+    return _load_config_for(mtime_ns, os.getenv("GITHUB_TOKEN"), os.getenv("DEVIN_API_KEY"))
+
+def invalidate_config_cache():
+    """Drop the get_cached_config() entry; save_config() calls this."""
+    _load_config_for.cache_clear()
+
 def save_config(config: AppConfig):
     """
     Saves config to local file.
@@ -90,6 +112,8 @@ def save_config(config: AppConfig):
         except AttributeError:
             content = config.json(indent=2)
         f.write(content)
+    # mtime can be too coarse to tell two quick saves apart
+    invalidate_config_cache()
     
     logger.info(f"Configuration saved to {CONFIG_FILE}")
 
@@ -2,15 +2,21 @@ import sys
 import os
 import re
 import json
+import hashlib
 import threading
 import time
 import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from difflib import SequenceMatcher
 import pandas as pd
 import streamlit as st
+from sqlalchemy import update
+from sqlalchemy.orm import load_only, undefer
 
 # --- FIX IMPORT PATHS ---
 current_dir = Path(__file__).parent
@@ -18,17 +24,17 @@ root_dir = current_dir.parent
 sys.path.append(str(root_dir))
 # ------------------------
 
-from devin_sheriff.models import SessionLocal, Repo, Issue, reset_database, get_db_path, init_db
+from devin_sheriff.models import SessionLocal, SessionFactory, Repo, Issue, reset_database, get_db_path, init_db
 from devin_sheriff.devin_client import DevinClient, load_governance_rules, save_governance_rules, RULES_FILE
-from devin_sheriff.config import load_config, save_config, CONFIG_DIR
-from devin_sheriff.sync import sync_repo_issues, sync_pr_statuses
+from devin_sheriff.config import AppConfig, load_config, save_config, CONFIG_DIR, CONFIG_FILE
+from devin_sheriff.sync import sync_repo_issues, sync_pr_statuses, GITHUB_URL_RE, PR_NUMBER_RE
 from devin_sheriff.github_client import GitHubClient
 from devin_sheriff.utils import test_webhook, notify_scope_complete, notify_pr_opened
 
 # --- LOGGING SETUP ---
 LOG_FILE = CONFIG_DIR / "sheriff.log"
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler(LOG_FILE),
@@ -37,6 +43,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger("dashboard")
 
+# --- PATTERNS ---
+TODO_PATTERNS = [
+    re.compile(r'#\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)', re.IGNORECASE),
+    re.compile(r'//\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)', re.IGNORECASE),
+    re.compile(r'/\*\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)', re.IGNORECASE),
+]
+
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
     page_title="Devin Sheriff v2.0",
@@ -82,13 +95,7 @@ st.markdown("""
 
 # --- SESSION STATE INITIALIZATION ---
 def init_session_state():
-    """Initialize session state variables for caching and async operations."""
-    if 'repos_cache' not in st.session_state:
-        st.session_state.repos_cache = None
-    if 'repos_cache_time' not in st.session_state:
-        st.session_state.repos_cache_time = None
-    if 'issues_cache' not in st.session_state:
-        st.session_state.issues_cache = {}
+    """Initialize session state variables for async operations and UI state."""
     if 'async_task' not in st.session_state:
         st.session_state.async_task = None
     if 'async_status' not in st.session_state:
@@ -102,40 +109,153 @@ def init_session_state():
 
 init_session_state()
 
+# --- TOASTS ---
+# A toast raised right before st.rerun() is wiped by the rerun, so actions
+# queue it here and the next run (app or fragment) shows it.
+def queue_toast(message: str, icon: Optional[str] = None):
+    """Show a toast at the start of the next run."""
+    st.session_state.setdefault("_pending_toasts", []).append((message, icon))
+
+def show_pending_toasts():
+    """Display and drop any toasts queued by the previous run."""
+    for message, icon in st.session_state.pop("_pending_toasts", []):
+        st.toast(message, icon=icon)
+
 # --- DATABASE HELPER ---
 def get_db():
     return SessionLocal()
 
+def update_issue_fields(db, issue_id: int, **values):
+    """
+    Apply several column changes to one issue as a single UPDATE + commit.
+    Skips per-attribute ORM change tracking for the reset/close paths.
+    """
+    db.execute(update(Issue).where(Issue.id == issue_id).values(**values))
+    db.commit()
+
+# --- CLIENT HELPERS ---
+# Config and API clients are built once and shared across reruns and sessions.
+# The config is keyed by config.json's mtime, so saving it (here or via
+# `main.py setup`) transparently reloads it on the next call.
+def _config_mtime() -> int:
+    try:
+        return CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_config(mtime_ns: int) -> AppConfig:
+    return load_config()
+
+# Keyed on the Devin settings only, so unrelated saves (e.g. the webhook) keep
+# the client. It is not closed on eviction: background scope/execute tasks may
+# still be polling with it, and it is released once the last of them is done.
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_devin_client(api_key: Optional[str], api_url: str, _config: AppConfig) -> DevinClient:
+    return DevinClient(_config)
+
+# Same for GitHub: keyed on the token, and never closed on eviction, since
+# another session may be mid-call on it; its pool and connections are freed
+# with the instance.
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_github_client(github_token: Optional[str], _config: AppConfig) -> GitHubClient:
+    return GitHubClient(_config)
+
+def get_app_config() -> AppConfig:
+    """Shared AppConfig. Treat as read-only; copy it before editing."""
+    return _cached_config(_config_mtime())
+
+def get_devin_client() -> DevinClient:
+    """Shared DevinClient."""
+    config = get_app_config()
+    return _cached_devin_client(config.devin_api_key, config.devin_api_url, config)
+
+def get_github_client() -> GitHubClient:
+    """Shared GitHubClient. Raises ValueError if no GitHub token is configured."""
+    config = get_app_config()
+    return _cached_github_client(config.github_token, config)
+
 # --- CACHING HELPERS ---
+# Read-only loaders shared across reruns. Writes clear just the entries they
+# touch (invalidate_issues for one repo); the TTL picks up CLI-side changes.
 CACHE_TTL = 30  # seconds
 
-def get_cached_repos(force_refresh=False):
-    """Get repos with caching to reduce DB queries."""
-    now = time.time()
-    if (not force_refresh and 
-        st.session_state.repos_cache is not None and 
-        st.session_state.repos_cache_time is not None and
-        now - st.session_state.repos_cache_time < CACHE_TTL):
-        return st.session_state.repos_cache
-    
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def get_repos() -> List[Repo]:
+    """All connected repos (detached copies)."""
     db = get_db()
     try:
-        repos = db.query(Repo).all()
-        st.session_state.repos_cache = repos
-        st.session_state.repos_cache_time = now
-        return repos
+        return db.query(Repo).all()
     finally:
-        db.close()
+        SessionLocal.remove()
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def get_issues(repo_id: int) -> List[Issue]:
+    """
+    Open issues of one repo for the queue and status counts.
+    Only the queue columns are loaded; re-query by id for anything else.
+    """
+    db = get_db()
+    try:
+        return db.query(Issue).options(
+            load_only(Issue.id, Issue.number, Issue.title, Issue.status)
+        ).filter(
+            Issue.repo_id == repo_id,
+            Issue.state == "open"
+        ).order_by(Issue.number).all()
+    finally:
+        SessionLocal.remove()
+
+def invalidate_issues(repo_id: Optional[int]):
+    """Drop the cached issue list of one repo after writing to its issues."""
+    if repo_id is not None:
+        get_issues.clear(repo_id)
 
 def invalidate_cache():
-    """Clear all caches to force fresh data."""
-    st.session_state.repos_cache = None
-    st.session_state.repos_cache_time = None
-    st.session_state.issues_cache = {}
+    """Clear all loaders, e.g. after repos are added or the DB is reset."""
+    get_repos.clear()
+    get_issues.clear()
 
 # --- ASYNC TASK HELPERS ---
+TASK_POLL_INTERVAL = 2  # seconds between progress-card refreshes
+
+def save_task_result(issue_id: int, task_type: str, result: Dict[str, Any]):
+    """
+    Persist a finished scope/execute result onto its issue.
+    Runs on the worker thread, keyed by id, so the result lands on the issue
+    that started the task even if the user has since selected another one.
+    """
+    db = get_db()
+    try:
+        if task_type == "execute":
+            update_issue_fields(db, issue_id, status="PR_OPEN", pr_url=result.get("pr_url"), last_error=None)
+            logger.info(f"PR created for issue id {issue_id}: {result.get('pr_url')}")
+        else:
+            update_issue_fields(
+                db, issue_id,
+                status="SCOPED", scope_json=result, confidence=result.get("confidence", 0), last_error=None
+            )
+            logger.info(f"Scoping completed for issue id {issue_id}")
+    finally:
+        SessionLocal.remove()
+
+def mark_task_failed(issue_id: int, status: Optional[str], error: str):
+    """Restore the issue's pre-task status and record the failure."""
+    db = get_db()
+    try:
+        values = {"last_error": error}
+        if status:
+            values["status"] = status
+        update_issue_fields(db, issue_id, **values)
+    finally:
+        SessionLocal.remove()
+
 class AsyncTaskRunner:
-    """Helper class to run Devin tasks in background threads."""
+    """
+    Helper class to run Devin tasks in background threads.
+    The worker writes its result straight to the DB; the UI only watches
+    this object's in-process status, so no API polling happens on reruns.
+    """
     
     def __init__(self):
         self.thread = None
@@ -144,21 +264,23 @@ class AsyncTaskRunner:
         self.error = None
         self.progress = 0
         self.task_type = None
+        self.issue_id = None
+        self.repo_id = None
     
     def run_scope(self, repo_url: str, issue_number: int, title: str, body: str, 
-                  repo_id: int = None):
+                  repo_id: int = None, issue_id: int = None):
         """Run scoping in background with Archive context."""
         self.status = "running"
         self.progress = 0
         self.error = None
         self.task_type = "scope"
+        self.issue_id = issue_id
+        self.repo_id = repo_id
+        # Resolve the shared client here; st.cache_resource needs the script thread
+        client = get_devin_client()
         
         def task():
             try:
-                self.progress = 10
-                cfg = load_config()
-                client = DevinClient(cfg)
-                
                 self.progress = 20
                 similar_context = None
                 if repo_id:
@@ -173,42 +295,75 @@ class AsyncTaskRunner:
                     similar_issues_context=similar_context
                 )
                 
+                if issue_id:
+                    save_task_result(issue_id, "scope", plan)
                 self.progress = 100
                 self.result = plan
                 self.status = "completed"
             except Exception as e:
                 self.error = str(e)
+                if issue_id:
+                    mark_task_failed(issue_id, None, self.error)
                 self.status = "failed"
         
         self.thread = threading.Thread(target=task, daemon=True)
         self.thread.start()
     
     def run_execute(self, repo_url: str, issue_number: int, title: str, plan_json: dict,
-                    ci_failure_context: Optional[str] = None):
-        """Run execution in background. Optionally accepts ci_failure_context for Auto-Healer."""
+                    ci_failure_context: Optional[str] = None, issue_id: int = None,
+                    previous_status: str = "SCOPED", repo_id: int = None):
+        """
+        Run execution in background. Optionally accepts ci_failure_context for Auto-Healer.
+        The issue shows as EXECUTING until the session ends, then moves to PR_OPEN
+        or back to previous_status on failure.
+        """
         self.status = "running"
         self.progress = 0
         self.error = None
         self.task_type = "execute"
+        self.issue_id = issue_id
+        self.repo_id = repo_id
+        
+        if issue_id:
+            # Own session: the caller's render is still using the thread-local one
+            db = SessionFactory()
+            try:
+                update_issue_fields(db, issue_id, status="EXECUTING")
+            finally:
+                db.close()
+            invalidate_issues(repo_id)
+        
+        client = get_devin_client()
+        # Resolved here for the same reason as client; None without a GitHub token
+        try:
+            gh = get_github_client()
+        except ValueError:
+            gh = None
         
         def task():
+            result = None
             try:
-                self.progress = 10
-                cfg = load_config()
-                client = DevinClient(cfg)
-                
                 self.progress = 30
                 result = client.start_execute_session(
                     repo_url, issue_number, title, plan_json,
                     ci_failure_context=ci_failure_context
                 )
+                if not result.get("pr_url"):
+                    raise RuntimeError(result.get("error") or "Devin finished without returning a PR URL")
                 
+                if issue_id:
+                    save_task_result(issue_id, "execute", result)
                 self.progress = 100
                 self.result = result
                 self.status = "completed"
             except Exception as e:
                 self.error = str(e)
+                if issue_id:
+                    mark_task_failed(issue_id, previous_status, self.error)
                 self.status = "failed"
+            finally:
+                # Devin just pushed, so drop any memoized PR/CI view of it
+                invalidate_pr(gh, repo_url, (result or {}).get("pr_url"))
         
         self.thread = threading.Thread(target=task, daemon=True)
         self.thread.start()
@@ -401,15 +556,40 @@ def analyze_risk_level(files_to_change: list) -> tuple:
 
 
 # --- LOG VIEWER HELPER ---
+LOG_TAIL_CHUNK = 4096  # bytes read per backward step
+LOG_TAIL_TTL = 5  # seconds; rapid refreshes reuse the last tail
+
+@st.cache_data(ttl=LOG_TAIL_TTL, show_spinner=False)
+def tail_log_file(path: str, num_lines: int) -> List[str]:
+    """
+    Return the last N lines of a file without reading the whole thing.
+    Seeks to EOF and reads backwards in fixed-size chunks until enough
+    newlines have been seen, so memory stays O(num_lines) however large the log grows.
+    """
+    chunks = []
+    newlines = 0
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        # One extra newline guarantees the oldest returned line is complete
+        while pos > 0 and newlines <= num_lines:
+            step = min(LOG_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    data = b"".join(reversed(chunks)).decode('utf-8', errors='replace')
+    return data.splitlines(keepends=True)[-num_lines:]
+
+
 def read_log_file(num_lines: int = 50) -> str:
     """Read the last N lines from the log file."""
     try:
         if not LOG_FILE.exists():
             return "No log file found. Logs will appear here after operations."
-        
-        with open(LOG_FILE, 'r') as f:
-            lines = f.readlines()
-            return ''.join(lines[-num_lines:])
+
+        return ''.join(tail_log_file(str(LOG_FILE), num_lines))
     except Exception as e:
         return f"Error reading log file: {e}"
 
@@ -423,7 +603,9 @@ def find_similar_closed_issues(current_title: str, repo_id: int, top_n: int = 2)
     """
     db = get_db()
     try:
-        closed_issues = db.query(Issue).filter(
+        closed_issues = db.query(Issue).options(
+            load_only(Issue.number, Issue.title, Issue.scope_json)
+        ).filter(
             Issue.repo_id == repo_id,
             Issue.state == "closed",
             Issue.status == "DONE"
@@ -451,7 +633,7 @@ def find_similar_closed_issues(current_title: str, repo_id: int, top_n: int = 2)
         similarities.sort(key=lambda x: x["similarity"], reverse=True)
         return similarities[:top_n]
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 def build_archive_context(similar_issues: List[Dict[str, Any]]) -> str:
@@ -472,6 +654,14 @@ def build_archive_context(similar_issues: List[Dict[str, Any]]) -> str:
 
 
 # --- AUTO-HEALER: CI STATUS HELPERS ---
+def invalidate_pr(gh: Optional[GitHubClient], repo_url: str, pr_url: Optional[str]):
+    """Forget gh's memoized PR and CI lookups for pr_url, e.g. once Devin has pushed to it."""
+    repo_match = GITHUB_URL_RE.search(repo_url)
+    pr_match = PR_NUMBER_RE.search(pr_url) if pr_url else None
+    if gh and repo_match and pr_match:
+        owner, name = repo_match.groups()
+        gh.invalidate(owner, name, int(pr_match.group(1)))
+
 def check_and_update_ci_status(issue: Issue, repo: Repo, db) -> Dict[str, Any]:
     """
     Check CI status for an issue with PR_OPEN status.
@@ -481,15 +671,15 @@ def check_and_update_ci_status(issue: Issue, repo: Repo, db) -> Dict[str, Any]:
         return {"status": "not_applicable"}
     
     try:
-        import re
-        pr_match = re.search(r"/pull/(\d+)", issue.pr_url)
+        pr_match = PR_NUMBER_RE.search(issue.pr_url)
         if not pr_match:
             return {"status": "unknown", "error": "Could not parse PR number"}
         
         pr_number = int(pr_match.group(1))
         
-        cfg = load_config()
-        gh = GitHubClient(cfg)
+        gh = get_github_client()
+        # Only explicit Check CI / Auto-Heal clicks land here, so skip the hot cache
+        gh.invalidate(repo.owner, repo.name, pr_number)
         ci_result = gh.get_pr_ci_status(repo.owner, repo.name, pr_number)
         
         issue.ci_status = ci_result["status"]
@@ -546,57 +736,118 @@ def get_ci_badge(ci_status: str, retry_count: int = 0) -> str:
 
 
 # --- THE WANTED LIST: TECH DEBT SCANNER ---
-def scan_for_todos(repo_path: str) -> List[Dict[str, Any]]:
-    """
-    Scan a local repository for TODO and FIXME comments.
-    Returns a list of dicts with file, line, and comment info.
-    """
+TODO_SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build'}
+TODO_SKIP_EXTENSIONS = {'.pyc', '.pyo', '.so', '.dll', '.exe', '.bin', '.jpg', '.png', '.gif'}
+TODO_SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)  # I/O-bound, so oversubscribe
+TODO_SCAN_TTL = 300  # seconds; re-clicking Scan reuses the last result
+
+
+def _scan_file_for_todos(file_path: Path, repo_path: Path) -> List[Dict[str, Any]]:
+    """Return the TODO-style comments found in a single file."""
+    if file_path.suffix.lower() in TODO_SKIP_EXTENSIONS:
+        return []
+
     todos = []
-    patterns = [
-        r'#\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)',
-        r'//\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)',
-        r'/\*\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)',
-    ]
-    
-    skip_dirs = {'.git', 'node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build'}
-    skip_extensions = {'.pyc', '.pyo', '.so', '.dll', '.exe', '.bin', '.jpg', '.png', '.gif'}
-    
-    repo_path = Path(repo_path)
-    if not repo_path.exists():
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line_num, line in enumerate(f, 1):
+                for pattern in TODO_PATTERNS:
+                    match = pattern.search(line)
+                    if match:
+                        tag = match.group(1).upper()
+                        comment = match.group(2).strip()[:100]
+                        todos.append({
+                            "file": str(file_path.relative_to(repo_path)),
+                            "line": line_num,
+                            "tag": tag,
+                            "comment": comment,
+                            "full_path": str(file_path)
+                        })
+                        break
+    except Exception:
         return []
-    
-    for file_path in repo_path.rglob('*'):
+    return todos
+
+
+def _scan_subtree_for_todos(entry: Path, repo_path: Path) -> List[Dict[str, Any]]:
+    """Scan one top-level entry of the repo (a file or a whole directory)."""
+    if not entry.is_dir():
+        return _scan_file_for_todos(entry, repo_path)
+
+    todos = []
+    for file_path in sorted(entry.rglob('*')):
         if file_path.is_dir():
             continue
-        
-        if any(skip_dir in file_path.parts for skip_dir in skip_dirs):
-            continue
-        
-        if file_path.suffix.lower() in skip_extensions:
-            continue
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    for pattern in patterns:
-                        match = re.search(pattern, line, re.IGNORECASE)
-                        if match:
-                            tag = match.group(1).upper()
-                            comment = match.group(2).strip()[:100]
-                            todos.append({
-                                "file": str(file_path.relative_to(repo_path)),
-                                "line": line_num,
-                                "tag": tag,
-                                "comment": comment,
-                                "full_path": str(file_path)
-                            })
-                            break
-        except Exception:
+        if any(skip_dir in file_path.relative_to(repo_path).parts for skip_dir in TODO_SKIP_DIRS):
             continue
-    
+        todos.extend(_scan_file_for_todos(file_path, repo_path))
     return todos
 
 
+def scan_for_todos(repo_path: str, on_progress=None) -> List[Dict[str, Any]]:
+    """
+    Scan a local repository for TODO and FIXME comments.
+    Returns a list of dicts with file, line, and comment info.
+
+    Top-level entries are scanned concurrently so file reads overlap; results
+    keep a stable order. on_progress(done, total) is called from the calling
+    thread as each subtree finishes.
+    """
+    repo_path = Path(repo_path)
+    if not repo_path.is_dir():
+        return []
+
+    entries = sorted(
+        Path(e.path) for e in os.scandir(repo_path)
+        if e.name not in TODO_SKIP_DIRS
+    )
+    if not entries:
+        return []
+
+    results: List[List[Dict[str, Any]]] = [[] for _ in entries]
+    with ThreadPoolExecutor(max_workers=min(TODO_SCAN_WORKERS, len(entries))) as pool:
+        futures = {
+            pool.submit(_scan_subtree_for_todos, entry, repo_path): i
+            for i, entry in enumerate(entries)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if on_progress:
+                on_progress(done, len(entries))
+
+    return list(chain.from_iterable(results))
+
+
+@st.cache_data(ttl=TODO_SCAN_TTL, show_spinner=False)
+def cached_scan_for_todos(repo_path: str, _on_progress=None) -> List[Dict[str, Any]]:
+    """scan_for_todos memoized per path; the progress callback is not hashed."""
+    return scan_for_todos(repo_path, on_progress=_on_progress)
+
+
+TRIBUNAL_CACHE_TTL = 3600  # seconds a verdict stays valid for an unchanged plan
+TRIBUNAL_CACHE_ENTRIES = 256
+
+
+def plan_hash(plan: Dict[str, Any]) -> str:
+    """Stable digest of a plan, independent of key order."""
+    encoded = json.dumps(plan, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+@st.cache_data(ttl=TRIBUNAL_CACHE_TTL, max_entries=TRIBUNAL_CACHE_ENTRIES, show_spinner=False)
+def tribunal_for_plan(plan_key: str, _plan: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run The Tribunal once per distinct plan. Cached on plan_key (see plan_hash);
+    failures raise so they are never memoized.
+    """
+    result = get_devin_client().start_tribunal_session(_plan)
+    # Any error dict is a failure, including the parse-failure one that
+    # carries no grade, so none of them are cached
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result
+
+
 def get_tribunal_grade_color(grade: str) -> str:
     """Return color for tribunal grade."""
     grade_colors = {
@@ -617,25 +868,23 @@ def get_mission_log_entries(num_entries: int = 20) -> List[Dict[str, Any]]:
         if not LOG_FILE.exists():
             return [{"time": datetime.now().strftime("%H:%M:%S"), "level": "INFO", "message": "Mission Log initialized. Waiting for activity..."}]
         
-        with open(LOG_FILE, 'r') as f:
-            lines = f.readlines()[-num_entries:]
-            for line in lines:
-                parts = line.strip().split(' - ', 3)
-                if len(parts) >= 4:
-                    timestamp = parts[0].split(' ')[-1] if ' ' in parts[0] else parts[0]
-                    level = parts[2] if len(parts) > 2 else "INFO"
-                    message = parts[3] if len(parts) > 3 else line.strip()
-                    entries.append({
-                        "time": timestamp[:8],
-                        "level": level,
-                        "message": message[:100]
-                    })
-                else:
-                    entries.append({
-                        "time": datetime.now().strftime("%H:%M:%S"),
-                        "level": "INFO",
-                        "message": line.strip()[:100]
-                    })
+        for line in tail_log_file(str(LOG_FILE), num_entries):
+            parts = line.strip().split(' - ', 3)
+            if len(parts) >= 4:
+                timestamp = parts[0].split(' ')[-1] if ' ' in parts[0] else parts[0]
+                level = parts[2] if len(parts) > 2 else "INFO"
+                message = parts[3] if len(parts) > 3 else line.strip()
+                entries.append({
+                    "time": timestamp[:8],
+                    "level": level,
+                    "message": message[:100]
+                })
+            else:
+                entries.append({
+                    "time": datetime.now().strftime("%H:%M:%S"),
+                    "level": "INFO",
+                    "message": line.strip()[:100]
+                })
     except Exception as e:
         entries.append({"time": datetime.now().strftime("%H:%M:%S"), "level": "ERROR", "message": f"Log read error: {e}"})
     
@@ -691,10 +940,8 @@ def render_first_run_wizard():
                 with st.spinner("Connecting to repository..."):
                     result = connect_repo_from_dashboard(repo_url)
                     if result["success"]:
-                        st.success(f"Successfully connected to **{result['repo_name']}**!")
-                        st.balloons()
                         invalidate_cache()
-                        time.sleep(2)
+                        queue_toast(f"Successfully connected to **{result['repo_name']}**!", icon="🎉")
                         st.rerun()
                     else:
                         st.error(result["error"])
@@ -702,7 +949,7 @@ def render_first_run_wizard():
         st.markdown("---")
         
         st.markdown("#### Quick Setup Checklist")
-        config = load_config()
+        config = get_app_config()
         
         gh_status = "configured" if config.github_token else "missing"
         devin_status = "configured" if config.devin_api_key else "missing"
@@ -728,21 +975,18 @@ def render_first_run_wizard():
 
 def connect_repo_from_dashboard(repo_url: str) -> Dict[str, Any]:
     """Connect a repository directly from the dashboard."""
-    import re
-    
-    config = load_config()
+    config = get_app_config()
     if not config.github_token:
         return {"success": False, "error": "GitHub Token not configured. Run 'python main.py setup' first."}
     
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
+    match = GITHUB_URL_RE.search(repo_url)
     if not match:
         return {"success": False, "error": "Invalid GitHub URL. Must be in format: github.com/owner/repo"}
     
     owner, repo_name = match.groups()
-    repo_name = repo_name.replace(".git", "").rstrip("/")
     
     try:
-        gh = GitHubClient(config)
+        gh = get_github_client()
         gh.get_repo_details(owner, repo_name)
     except Exception as e:
         error_msg = str(e)
@@ -774,16 +1018,17 @@ def connect_repo_from_dashboard(repo_url: str) -> Dict[str, Any]:
         db.rollback()
         return {"success": False, "error": f"Database error: {str(e)}"}
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # --- MAIN DASHBOARD LOGIC ---
 def main():
+    show_pending_toasts()
     st.title("🤠 Devin Sheriff v2.0")
 
     # 1. SIDEBAR: REPOSITORY SELECTION
     st.sidebar.header("📂 Repository")
-    repos = get_cached_repos()
+    repos = get_repos()
     
     # FEATURE A: First-Run Wizard
     if not repos:
@@ -804,7 +1049,7 @@ def main():
             try:
                 sync_repo_issues(selected_repo.url)
                 sync_pr_statuses(selected_repo.url)
-                invalidate_cache()
+                invalidate_issues(selected_repo.id)
                 st.session_state[auto_sync_key] = True
             except Exception as e:
                 st.sidebar.warning(f"Auto-sync failed: {e}")
@@ -821,9 +1066,8 @@ def main():
             with st.spinner(f"Syncing {selected_repo.name}..."):
                 try:
                     msg = sync_repo_issues(selected_repo.url)
-                    invalidate_cache()
-                    st.success(msg)
-                    time.sleep(1)
+                    invalidate_issues(selected_repo.id)
+                    queue_toast(msg, icon="🔄")
                     st.rerun()
                 except Exception as e:
                     st.error(f"Sync failed: {e}")
@@ -834,15 +1078,14 @@ def main():
                 try:
                     sync_repo_issues(selected_repo.url)
                     result = sync_pr_statuses(selected_repo.url)
-                    invalidate_cache()
+                    invalidate_issues(selected_repo.id)
                     
                     if result.get("error"):
                         st.error(result["error"])
                     else:
                         stats = result["stats"]
-                        st.success(f"PRs checked: {stats['prs_checked']}, Merged: {stats['prs_merged']}, Issues updated: {stats['issues_updated']}")
-                    time.sleep(1.5)
-                    st.rerun()
+                        queue_toast(f"PRs checked: {stats['prs_checked']}, Merged: {stats['prs_merged']}, Issues updated: {stats['issues_updated']}", icon="🔍")
+                        st.rerun()
                 except Exception as e:
                     st.error(f"Deep sync failed: {e}")
 
@@ -889,6 +1132,7 @@ def render_live_mission_log():
     
     with col3:
         if st.button("🔄 Refresh Now", use_container_width=True):
+            tail_log_file.clear()
             st.rerun()
     
     st.markdown("---")
@@ -970,116 +1214,137 @@ def render_live_mission_log():
             try:
                 if LOG_FILE.exists():
                     LOG_FILE.write_text("")
-                    st.success("Log file cleared!")
-                    time.sleep(1)
+                    tail_log_file.clear()
+                    queue_toast("Log file cleared!", icon="🗑️")
                     st.rerun()
             except Exception as e:
                 st.error(f"Error clearing log: {e}")
 
 
 # --- MISSION CONTROL: 3-COLUMN LAYOUT ---
+QUEUE_PAGE_SIZE = 50  # queue buttons rendered per page
+
+QUEUE_STATUS_EMOJI = {
+    "NEW": "🆕",
+    "SCOPED": "📋",
+    "EXECUTING": "⚙️",
+    "PR_OPEN": "🚀",
+    "DONE": "✅",
+    "FAILED": "❌"
+}
+
 def render_mission_control(selected_repo, filter_status):
     """Render the Mission Control dashboard with 3-column layout for high data density."""
-    db = get_db()
-    
-    try:
-        all_issues = db.query(Issue).filter(
-            Issue.repo_id == selected_repo.id,
-            Issue.state == "open"
-        ).all()
-        
-        count_new = len([i for i in all_issues if i.status == "NEW"])
-        count_scoped = len([i for i in all_issues if i.status == "SCOPED"])
-        count_pr = len([i for i in all_issues if i.status == "PR_OPEN"])
-        count_executing = len([i for i in all_issues if i.status == "EXECUTING"])
-
-        st.markdown("### 📊 Status Overview")
-        m1, m2, m3, m4 = st.columns(4)
-        m1.metric("🆕 New", count_new)
-        m2.metric("📋 Scoped", count_scoped)
-        m3.metric("⚙️ Executing", count_executing)
-        m4.metric("🚀 PRs Open", count_pr)
-
-        st.divider()
-
-        if filter_status == "New / Untouched":
-            display_issues = [i for i in all_issues if i.status == "NEW"]
-        elif filter_status == "Scoped (Ready to Fix)":
-            display_issues = [i for i in all_issues if i.status == "SCOPED"]
-        elif filter_status == "PR Open":
-            display_issues = [i for i in all_issues if i.status == "PR_OPEN"]
-        else:
-            display_issues = all_issues
+    ss = st.session_state
+    
+    all_issues = get_issues(selected_repo.id)
+    
+    count_new = len([i for i in all_issues if i.status == "NEW"])
+    count_scoped = len([i for i in all_issues if i.status == "SCOPED"])
+    count_pr = len([i for i in all_issues if i.status == "PR_OPEN"])
+    count_executing = len([i for i in all_issues if i.status == "EXECUTING"])
+
+    st.markdown("### 📊 Status Overview")
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("🆕 New", count_new)
+    m2.metric("📋 Scoped", count_scoped)
+    m3.metric("⚙️ Executing", count_executing)
+    m4.metric("🚀 PRs Open", count_pr)
+
+    st.divider()
+
+    if filter_status == "New / Untouched":
+        display_issues = [i for i in all_issues if i.status == "NEW"]
+    elif filter_status == "Scoped (Ready to Fix)":
+        display_issues = [i for i in all_issues if i.status == "SCOPED"]
+    elif filter_status == "PR Open":
+        display_issues = [i for i in all_issues if i.status == "PR_OPEN"]
+    else:
+        display_issues = all_issues
 
-        if not display_issues:
-            st.info(f"No issues found matching filter: **{filter_status}**")
-            st.markdown("---")
-            st.markdown("#### Quick Actions")
-            if st.button("🔄 Sync Issues from GitHub", use_container_width=True):
-                with st.spinner("Syncing..."):
-                    msg = sync_repo_issues(selected_repo.url)
-                    invalidate_cache()
-                    st.success(msg)
-                    time.sleep(1)
-                    st.rerun()
-            return
+    if not display_issues:
+        st.info(f"No issues found matching filter: **{filter_status}**")
+        st.markdown("---")
+        st.markdown("#### Quick Actions")
+        if st.button("🔄 Sync Issues from GitHub", use_container_width=True):
+            with st.spinner("Syncing..."):
+                msg = sync_repo_issues(selected_repo.url)
+                invalidate_issues(selected_repo.id)
+                queue_toast(msg, icon="🔄")
+                st.rerun()
+        return
 
-        col_list, col_detail, col_actions = st.columns([1, 2, 1])
+    col_list, col_detail, col_actions = st.columns([1, 2, 1])
+    
+    with col_list:
+        st.markdown("#### 📋 Issue Queue")
+        
+        if 'selected_issue_number' not in ss and display_issues:
+            ss.selected_issue_number = display_issues[0].number
+        selected_number = ss.get('selected_issue_number')
+        
+        # Long queues render one page of buttons at a time
+        visible_issues = display_issues
+        if len(display_issues) > QUEUE_PAGE_SIZE:
+            page_count = -(-len(display_issues) // QUEUE_PAGE_SIZE)
+            page = st.selectbox(
+                "Page",
+                range(1, page_count + 1),
+                format_func=lambda p: f"Page {p} of {page_count}",
+                key=f"queue_page_{selected_repo.id}_{filter_status}",
+                label_visibility="collapsed"
+            )
+            start = (page - 1) * QUEUE_PAGE_SIZE
+            visible_issues = display_issues[start:start + QUEUE_PAGE_SIZE]
         
-        with col_list:
-            st.markdown("#### 📋 Issue Queue")
-            
-            issue_options = {f"#{i.number}: {i.title[:30]}..." if len(i.title) > 30 else f"#{i.number}: {i.title}": i.number for i in display_issues}
-            
-            for label, num in issue_options.items():
-                issue = next((i for i in display_issues if i.number == num), None)
-                if issue:
-                    status_emoji = {
-                        "NEW": "🆕",
-                        "SCOPED": "📋",
-                        "EXECUTING": "⚙️",
-                        "PR_OPEN": "🚀",
-                        "DONE": "✅",
-                        "FAILED": "❌"
-                    }.get(issue.status, "❓")
-                    
-                    is_selected = st.session_state.get('selected_issue_number') == num
-                    button_type = "primary" if is_selected else "secondary"
-                    
-                    if st.button(f"{status_emoji} #{issue.number}", key=f"issue_btn_{num}", use_container_width=True, type=button_type):
-                        st.session_state.selected_issue_number = num
-                        st.rerun()
+        for issue in visible_issues:
+            num = issue.number
+            status_emoji = QUEUE_STATUS_EMOJI.get(issue.status, "❓")
+            button_type = "primary" if num == selected_number else "secondary"
             
-            if 'selected_issue_number' not in st.session_state and display_issues:
-                st.session_state.selected_issue_number = display_issues[0].number
-        
-        selected_number = st.session_state.get('selected_issue_number')
-        current_issue = None
-        if selected_number:
-            current_issue = db.query(Issue).filter(
-                Issue.repo_id == selected_repo.id, 
-                Issue.number == selected_number
-            ).first()
-        
-        with col_detail:
-            if current_issue:
-                render_issue_detail_panel(current_issue, selected_repo, db)
-            else:
-                st.info("Select an issue from the queue to view details.")
-        
-        with col_actions:
-            if current_issue:
-                render_action_panel(current_issue, selected_repo, db)
-            else:
-                st.markdown("#### ⚡ Actions")
-                st.caption("Select an issue to see available actions.")
-                
+            if st.button(f"{status_emoji} #{num}", key=f"issue_btn_{num}", help=issue.display_label, use_container_width=True, type=button_type):
+                ss.selected_issue_number = num
+                st.rerun()
+    
+    # The fragments below open their own sessions, so pass plain ids
+    issue_id = next((i.id for i in all_issues if i.number == selected_number), None)
+    repo_id = selected_repo.id
+    
+    with col_detail:
+        if issue_id:
+            render_issue_detail_panel(issue_id, repo_id)
+        else:
+            st.info("Select an issue from the queue to view details.")
+    
+    with col_actions:
+        if issue_id:
+            render_action_panel(issue_id, repo_id)
+        else:
+            st.markdown("#### ⚡ Actions")
+            st.caption("Select an issue to see available actions.")
+
+
+@st.fragment
+def render_issue_detail_panel(issue_id: int, repo_id: int):
+    """
+    Render the central detail panel for an issue.
+    Runs as a fragment, so it takes ids and re-queries with its own session
+    instead of capturing the caller's (already closed) one.
+    """
+    db = get_db()
+    try:
+        issue = db.get(Issue, issue_id, options=[undefer(Issue.scope_json)])
+        repo = db.get(Repo, repo_id)
+        if not issue or not repo:
+            st.info("Select an issue from the queue to view details.")
+            return
+        render_issue_detail_body(issue, repo, db)
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
-def render_issue_detail_panel(issue, repo, db):
-    """Render the central detail panel for an issue."""
+def render_issue_detail_body(issue, repo, db):
+    """Render the detail panel contents for a loaded issue."""
     st.markdown(f"#### Issue #{issue.number}")
     st.markdown(f"**{issue.title}**")
     
@@ -1094,8 +1359,11 @@ def render_issue_detail_panel(issue, repo, db):
     status_color = status_colors.get(issue.status, "gray")
     st.markdown(f"Status: :{status_color}[**{issue.status}**]")
     
-    with st.expander("📖 Description", expanded=False):
-        st.markdown(issue.body if issue.body else "*No description provided.*")
+    # Expanders track their open state so collapsed bodies are never built
+    description = st.expander("📖 Description", key=f"desc_open_{issue.id}", on_change="rerun")
+    if description.open:
+        with description:
+            st.markdown(issue.body if issue.body else "*No description provided.*")
     
     if issue.scope_json:
         if "error" in issue.scope_json:
@@ -1108,14 +1376,16 @@ def render_issue_detail_panel(issue, repo, db):
             risk_emoji = {"HIGH": "🔴", "MEDIUM": "🟠", "LOW": "🟢", "UNKNOWN": "⚪"}.get(risk_level, "⚪")
             st.markdown(f"**Risk:** {risk_emoji} :{risk_color}[{risk_level}] - {risk_desc}")
             
-            with st.expander("📋 Action Plan", expanded=True):
-                st.markdown("**Strategy:**")
-                for step in issue.scope_json.get("action_plan", []):
-                    st.markdown(f"- {step}")
-                
-                st.markdown("**Files to Change:**")
-                for f in files_to_change:
-                    st.code(f, language="bash")
+            plan_expander = st.expander("📋 Action Plan", expanded=True, key=f"plan_open_{issue.id}", on_change="rerun")
+            if plan_expander.open:
+                with plan_expander:
+                    render_plan_display(issue.scope_json)
+            
+            # Plan tools for SCOPED issues: editor, Tribunal review, Interrogation Room
+            if issue.status == "SCOPED":
+                render_plan_editor(issue, db)
+                render_tribunal_section(issue, repo)
+                render_interrogation_room(issue, repo, db)
     
     if issue.pr_url:
         st.markdown("---")
@@ -1153,56 +1423,93 @@ def render_confidence_badge(confidence: int):
         st.error(f"{zone_emoji} **Confidence: {confidence}%** - AI needs guidance")
 
 
-def render_action_panel(issue, repo, db):
-    """Render the action panel for an issue with Confidence Protocol."""
+@st.fragment
+def render_action_panel(issue_id: int, repo_id: int):
+    """
+    Render the action panel for an issue with Confidence Protocol.
+    Runs as a fragment: buttons that only affect this panel rerun just the
+    panel, while anything that changes the issue's status or plan reruns the
+    whole app so the queue and detail panel pick it up.
+    """
+    show_pending_toasts()
+    db = get_db()
+    try:
+        issue = db.get(Issue, issue_id, options=[undefer(Issue.scope_json)])
+        repo = db.get(Repo, repo_id)
+        if not issue or not repo:
+            st.markdown("#### ⚡ Actions")
+            st.caption("Select an issue to see available actions.")
+            return
+        render_action_panel_body(issue, repo, db)
+    finally:
+        SessionLocal.remove()
+
+
+@st.fragment(run_every=TASK_POLL_INTERVAL)
+def render_task_progress():
+    """
+    Progress card for the running background task.
+    Refreshes itself on a timer from in-process state only (the Devin API has
+    no long-poll or callback to subscribe to); once the worker has written its
+    result to the DB, one app rerun picks it up.
+    """
+    task_runner = st.session_state.task_runner
+    if not task_runner.is_running():
+        st.rerun()
+    
+    with st.status("🔄 Task in progress...", expanded=True) as status:
+        progress = task_runner.get_progress()
+        if task_runner.task_type == "scope":
+            if progress < 20:
+                st.write("🔐 Authenticating with Devin...")
+            elif progress < 40:
+                st.write("📖 Reading repository structure...")
+            elif progress < 70:
+                st.write("🔍 Analyzing issue and codebase...")
+            else:
+                st.write("📋 Generating action plan...")
+        else:
+            if progress < 20:
+                st.write("🔐 Authenticating with Devin...")
+            elif progress < 40:
+                st.write("📖 Cloning repository...")
+            elif progress < 60:
+                st.write("💻 Writing code changes...")
+            elif progress < 80:
+                st.write("🧪 Running tests...")
+            else:
+                st.write("🚀 Creating pull request...")
+        
+        st.progress(progress / 100)
+
+
+def render_action_panel_body(issue, repo, db):
+    """Render the action panel contents for a loaded issue."""
     st.markdown("#### ⚡ Actions")
     
-    task_runner = st.session_state.task_runner
+    ss = st.session_state
+    task_runner = ss.task_runner
+    edited_plan = ss.get('edited_plan')
     
     if task_runner.status == "completed":
-        handle_task_completion(issue, task_runner, db)
+        handle_task_completion(task_runner)
         st.rerun()
     elif task_runner.status == "failed":
         render_error_help_card("unknown", task_runner.error or "Unknown error")
         task_runner.status = "idle"
+        invalidate_issues(task_runner.repo_id)
     
     if task_runner.is_running():
-        with st.status("🔄 Task in progress...", expanded=True) as status:
-            progress = task_runner.get_progress()
-            if task_runner.task_type == "scope":
-                if progress < 20:
-                    st.write("🔐 Authenticating with Devin...")
-                elif progress < 40:
-                    st.write("📖 Reading repository structure...")
-                elif progress < 70:
-                    st.write("🔍 Analyzing issue and codebase...")
-                else:
-                    st.write("📋 Generating action plan...")
-            else:
-                if progress < 20:
-                    st.write("🔐 Authenticating with Devin...")
-                elif progress < 40:
-                    st.write("📖 Cloning repository...")
-                elif progress < 60:
-                    st.write("💻 Writing code changes...")
-                elif progress < 80:
-                    st.write("🧪 Running tests...")
-                else:
-                    st.write("🚀 Creating pull request...")
-            
-            st.progress(progress / 100)
-        time.sleep(2)
-        st.rerun()
+        render_task_progress()
     else:
         if issue.status in ["NEW", "DONE"]:
             if st.button("🔍 Scope Issue", key=f"scope_{issue.id}", type="primary", use_container_width=True):
                 with st.status("Starting scope session...", expanded=True) as status:
                     st.write("🔐 Authenticating...")
-                    task_runner.run_scope(repo.url, issue.number, issue.title, issue.body, repo_id=repo.id)
+                    task_runner.run_scope(repo.url, issue.number, issue.title, issue.body, repo_id=repo.id, issue_id=issue.id)
                     st.write("📤 Request sent to Devin")
-                st.toast("🔍 Scoping started!", icon="🔍")
-                time.sleep(1)
-                st.rerun()
+                queue_toast("🔍 Scoping started!", icon="🔍")
+                st.rerun(scope="fragment")
         
         # --- CONFIDENCE PROTOCOL ---
         if issue.status == "SCOPED":
@@ -1214,8 +1521,8 @@ def render_action_panel(issue, repo, db):
             
             # Initialize session state for plan review tracking
             plan_reviewed_key = f"plan_reviewed_{issue.id}"
-            if plan_reviewed_key not in st.session_state:
-                st.session_state[plan_reviewed_key] = False
+            if plan_reviewed_key not in ss:
+                ss[plan_reviewed_key] = False
             
             # GREEN ZONE (>85%): Auto-Execute available
             if zone_name == "GREEN":
@@ -1225,11 +1532,10 @@ def render_action_panel(issue, repo, db):
                 if st.button("🚀 Auto-Execute", key=f"auto_exec_{issue.id}", type="primary", use_container_width=True):
                     with st.status("Starting execution...", expanded=True) as status:
                         st.write("🔐 Authenticating...")
-                        plan_to_use = st.session_state.get('edited_plan') or issue.scope_json
-                        task_runner.run_execute(repo.url, issue.number, issue.title, plan_to_use)
+                        plan_to_use = edited_plan or issue.scope_json
+                        task_runner.run_execute(repo.url, issue.number, issue.title, plan_to_use, issue_id=issue.id, repo_id=repo.id)
                         st.write("📤 Request sent to Devin")
-                    st.toast("🚀 Execution started!", icon="🚀")
-                    time.sleep(1)
+                    queue_toast("🚀 Execution started!", icon="🚀")
                     st.rerun()
             
             # YELLOW ZONE (50-85%): Review required before execution
@@ -1238,9 +1544,12 @@ def render_action_panel(issue, repo, db):
                 st.caption("The AI has some uncertainty. Please review the plan before proceeding.")
                 
                 # Check if user has reviewed the plan
-                if not st.session_state[plan_reviewed_key]:
-                    with st.expander("📋 View Action Plan (Required)", expanded=False):
-                        if issue.scope_json:
+                if not ss[plan_reviewed_key]:
+                    review_expander = st.expander(
+                        "📋 View Action Plan (Required)", key=f"review_open_{issue.id}", on_change="rerun"
+                    )
+                    if review_expander.open and issue.scope_json:
+                        with review_expander:
                             st.markdown("**Summary:**")
                             st.info(issue.scope_json.get("summary", "No summary available"))
                             
@@ -1254,9 +1563,9 @@ def render_action_panel(issue, repo, db):
                             
                             st.markdown("---")
                             if st.button("✅ I have reviewed the plan", key=f"review_confirm_{issue.id}", type="primary", use_container_width=True):
-                                st.session_state[plan_reviewed_key] = True
-                                st.toast("Plan reviewed! Execute button unlocked.", icon="✅")
-                                st.rerun()
+                                ss[plan_reviewed_key] = True
+                                queue_toast("Plan reviewed! Execute button unlocked.", icon="✅")
+                                st.rerun(scope="fragment")
                     
                     st.button("⚠️ Review & Approve", key=f"yellow_exec_{issue.id}", disabled=True, use_container_width=True)
                     st.caption("⬆️ Expand and review the plan above to unlock execution")
@@ -1265,11 +1574,10 @@ def render_action_panel(issue, repo, db):
                     if st.button("⚠️ Review & Approve", key=f"yellow_exec_{issue.id}", type="primary", use_container_width=True):
                         with st.status("Starting execution...", expanded=True) as status:
                             st.write("🔐 Authenticating...")
-                            plan_to_use = st.session_state.get('edited_plan') or issue.scope_json
-                            task_runner.run_execute(repo.url, issue.number, issue.title, plan_to_use)
+                            plan_to_use = edited_plan or issue.scope_json
+                            task_runner.run_execute(repo.url, issue.number, issue.title, plan_to_use, issue_id=issue.id, repo_id=repo.id)
                             st.write("📤 Request sent to Devin")
-                        st.toast("🚀 Execution started!", icon="🚀")
-                        time.sleep(1)
+                        queue_toast("🚀 Execution started!", icon="🚀")
                         st.rerun()
             
             # RED ZONE (<50%): Execution blocked
@@ -1298,8 +1606,7 @@ def render_action_panel(issue, repo, db):
                             st.write("🔐 Authenticating...")
                             st.write("📝 Incorporating your feedback...")
                             try:
-                                cfg = load_config()
-                                client = DevinClient(cfg)
+                                client = get_devin_client()
                                 
                                 st.write("🔍 Analyzing with new context...")
                                 new_plan = client.start_rescope_session(
@@ -1314,20 +1621,18 @@ def render_action_panel(issue, repo, db):
                                 issue.scope_json = new_plan
                                 issue.confidence = new_plan.get("confidence", 0)
                                 db.commit()
-                                invalidate_cache()
+                                invalidate_issues(repo.id)
                                 
                                 st.write("✅ Plan updated!")
                                 status.update(label="Re-scope complete!", state="complete")
                                 
                                 new_conf = new_plan.get("confidence", 0)
                                 if new_conf > 85:
-                                    st.toast(f"Confidence boosted to {new_conf}%! Green Zone unlocked.", icon="🟢")
+                                    queue_toast(f"Confidence boosted to {new_conf}%! Green Zone unlocked.", icon="🟢")
                                 elif new_conf >= 50:
-                                    st.toast(f"Confidence improved to {new_conf}%. Yellow Zone.", icon="🟡")
+                                    queue_toast(f"Confidence improved to {new_conf}%. Yellow Zone.", icon="🟡")
                                 else:
-                                    st.toast(f"Confidence at {new_conf}%. Try adding more context.", icon="🔴")
-                                
-                                time.sleep(1)
+                                    queue_toast(f"Confidence at {new_conf}%. Try adding more context.", icon="🔴")
                                 st.rerun()
                                 
                             except Exception as e:
@@ -1336,14 +1641,11 @@ def render_action_panel(issue, repo, db):
             
             st.markdown("---")
             if st.button("🔄 Start Fresh (Re-Scope)", key=f"rescope_{issue.id}", use_container_width=True):
-                issue.status = "NEW"
-                issue.scope_json = None
-                issue.confidence = 0
-                st.session_state.edited_plan = None
-                st.session_state[plan_reviewed_key] = False
-                db.commit()
-                invalidate_cache()
-                st.toast("Issue reset. Ready for fresh scoping.", icon="🔄")
+                update_issue_fields(db, issue.id, status="NEW", scope_json=None, confidence=0)
+                ss.edited_plan = None
+                ss[plan_reviewed_key] = False
+                invalidate_issues(repo.id)
+                queue_toast("Issue reset. Ready for fresh scoping.", icon="🔄")
                 st.rerun()
         
         if issue.status == "PR_OPEN" and issue.pr_url:
@@ -1355,7 +1657,7 @@ def render_action_panel(issue, repo, db):
                     if ci_result["status"] == "passing":
                         st.write("✅ All checks passed!")
                         status.update(label="CI Passing!", state="complete")
-                        st.toast("All CI checks passed!", icon="✅")
+                        queue_toast("All CI checks passed!", icon="✅")
                     elif ci_result["status"] == "failing":
                         st.write(f"❌ {len(ci_result.get('failures', []))} check(s) failed")
                         status.update(label="CI Failing", state="error")
@@ -1365,7 +1667,7 @@ def render_action_panel(issue, repo, db):
                     elif ci_result["status"] == "pending":
                         st.write("⏳ Checks still running...")
                         status.update(label="CI Pending", state="running")
-                        st.toast("CI checks still running...", icon="⏳")
+                        queue_toast("CI checks still running...", icon="⏳")
                     else:
                         st.write("❓ Status unknown")
                 
@@ -1383,12 +1685,12 @@ def render_action_panel(issue, repo, db):
                             plan_to_use = issue.scope_json or {}
                             task_runner.run_execute(
                                 repo.url, issue.number, issue.title, plan_to_use,
-                                ci_failure_context=heal_result.get("failure_context")
+                                ci_failure_context=heal_result.get("failure_context"),
+                                issue_id=issue.id, previous_status="PR_OPEN", repo_id=repo.id
                             )
                             st.write("📤 Request sent to Devin")
                             status.update(label="Auto-Heal started!", state="complete")
-                            st.toast(f"Auto-Heal triggered (Retry {heal_result['retry_count']}/3)", icon="🔧")
-                            time.sleep(1)
+                            queue_toast(f"Auto-Heal triggered (Retry {heal_result['retry_count']}/3)", icon="🔧")
                             st.rerun()
                         else:
                             st.error(heal_result["error"])
@@ -1399,34 +1701,31 @@ def render_action_panel(issue, repo, db):
     if issue.status != "DONE":
         if st.button("✅ Close Issue", key=f"close_{issue.id}", use_container_width=True):
             with st.status("Closing issue...", expanded=True) as status:
-                st.write("📝 Updating local database...")
+                st.write("🌐 Closing on GitHub...")
                 result = close_issue_workflow(issue, repo, db, close_on_github=True)
                 
                 if result["github_closed"]:
                     st.write("🌐 Closed on GitHub")
                     status.update(label="Issue closed!", state="complete")
-                    st.toast(f"Issue #{issue.number} closed on GitHub!", icon="✅")
+                    queue_toast(f"Issue #{issue.number} closed on GitHub!", icon="✅")
                 elif result["error_message"]:
                     st.write(f"⚠️ GitHub: {result['error_message']}")
-                    status.update(label="Closed locally only", state="error")
+                    status.update(label="Closed locally only" if result["local_closed"] else "Issue not closed", state="error")
                     render_error_help_card(result.get("error_type", "unknown"), result["error_message"])
                 else:
                     status.update(label="Closed locally", state="complete")
-                    st.toast(f"Issue #{issue.number} closed locally", icon="✅")
+                    queue_toast(f"Issue #{issue.number} closed locally", icon="✅")
             
-            invalidate_cache()
-            time.sleep(1)
-            st.rerun()
+            invalidate_issues(repo.id)
+            # Keep the help card on screen when GitHub refused the close
+            if not result["error_message"]:
+                st.rerun()
     
     if st.button("🗑 Reset State", key=f"reset_{issue.id}", use_container_width=True):
-        issue.status = "NEW"
-        issue.scope_json = None
-        issue.confidence = None
-        issue.pr_url = None
-        st.session_state.edited_plan = None
-        db.commit()
-        invalidate_cache()
-        st.toast("Issue state reset.", icon="🗑")
+        update_issue_fields(db, issue.id, status="NEW", scope_json=None, confidence=None, pr_url=None)
+        ss.edited_plan = None
+        invalidate_issues(repo.id)
+        queue_toast("Issue state reset.", icon="🗑")
         st.rerun()
 
 
@@ -1439,7 +1738,11 @@ def render_settings_security():
     """Render the Settings & Security section in sidebar."""
     st.sidebar.markdown("---")
     
-    with st.sidebar.expander("⚙️ Settings & Security", expanded=False):
+    settings = st.sidebar.expander("⚙️ Settings & Security", key="settings_open", on_change="rerun")
+    if not settings.open:
+        return
+
+    with settings:
         st.markdown("**Local Storage Paths**")
         st.caption("Your data is stored locally on your machine:")
         
@@ -1454,7 +1757,7 @@ def render_settings_security():
         st.markdown("**The Telegraph (Webhooks)**")
         st.caption("Configure a webhook URL to receive notifications (Slack/Discord).")
         
-        config = load_config()
+        config = get_app_config().model_copy()
         current_webhook = config.webhook_url or ""
         
         new_webhook = st.text_input("Webhook URL", value=current_webhook, placeholder="https://hooks.slack.com/...")
@@ -1464,8 +1767,7 @@ def render_settings_security():
             if st.button("💾 Save Webhook", use_container_width=True):
                 config.webhook_url = new_webhook if new_webhook else None
                 save_config(config)
-                st.success("Webhook saved!")
-                time.sleep(1)
+                queue_toast("Webhook saved!", icon="💾")
                 st.rerun()
         
         with col2:
@@ -1508,8 +1810,7 @@ def render_danger_zone():
                             invalidate_cache()
                             for key in list(st.session_state.keys()):
                                 del st.session_state[key]
-                            st.success("Database reset complete!")
-                            time.sleep(1)
+                            queue_toast("Database reset complete!", icon="🧨")
                             st.rerun()
                         else:
                             st.error("Reset failed. Check logs for details.")
@@ -1527,6 +1828,7 @@ def render_log_viewer():
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh Logs"):
+            tail_log_file.clear()
             st.rerun()
     
     log_content = read_log_file(50)
@@ -1553,8 +1855,7 @@ def render_laws_tab():
     with col1:
         if st.button("💾 Save Rules", type="primary", use_container_width=True):
             if save_governance_rules(edited_rules):
-                st.success("Rules saved successfully!")
-                time.sleep(1)
+                queue_toast("Rules saved successfully!", icon="💾")
                 st.rerun()
             else:
                 st.error("Failed to save rules. Check logs for details.")
@@ -1563,8 +1864,7 @@ def render_laws_tab():
         if st.button("🔄 Reset to Default", use_container_width=True):
             from devin_sheriff.devin_client import DEFAULT_RULES
             if save_governance_rules(DEFAULT_RULES):
-                st.success("Rules reset to default!")
-                time.sleep(1)
+                queue_toast("Rules reset to default!", icon="🔄")
                 st.rerun()
             else:
                 st.error("Failed to reset rules.")
@@ -1583,209 +1883,6 @@ def render_laws_tab():
     """)
 
 
-# --- WORKSPACE RENDERER ---
-def render_issue_workspace(issue, repo, db):
-    """Renders the detailed view and action buttons for a single issue."""
-    
-    c1, c2 = st.columns([2, 1])
-
-    with c1:
-        st.markdown(f"### Issue #{issue.number}: {issue.title}")
-        with st.expander("📖 View Issue Description", expanded=True):
-            st.markdown(issue.body if issue.body else "*No description provided.*")
-
-        if issue.scope_json:
-            # Check if scope_json contains an error (failed to parse Devin response)
-            if "error" in issue.scope_json:
-                st.error(f"**Scoping Failed:** {issue.scope_json.get('error', 'Unknown error')}")
-                st.caption("Try re-scoping this issue or check the Live Logs for details.")
-            else:
-                st.success(f"**Plan Ready** (Confidence: {issue.confidence}%)")
-            
-            # FEATURE 2: Risk Level Badge (Suspect Profiling)
-            files_to_change = issue.scope_json.get("files_to_change", [])
-            risk_level, risk_color, risk_desc = analyze_risk_level(files_to_change)
-            
-            risk_emoji = {"HIGH": "🔴", "MEDIUM": "🟠", "LOW": "🟢", "UNKNOWN": "⚪"}.get(risk_level, "⚪")
-            st.markdown(f"**Risk Level:** {risk_emoji} :{risk_color}[{risk_level}]")
-            st.caption(risk_desc)
-            
-            # Plan Editor Feature for SCOPED issues
-            if issue.status == "SCOPED":
-                render_plan_editor(issue, db)
-                
-                # FEATURE: The Tribunal (Plan Review)
-                render_tribunal_section(issue, repo)
-                
-                # FEATURE 3: The Interrogation Room (Refine Plan)
-                render_interrogation_room(issue, repo, db)
-            else:
-                with st.expander("📋 View Action Plan", expanded=True):
-                    render_plan_display(issue.scope_json)
-
-    with c2:
-        st.markdown("### ⚡ Actions")
-        
-        status_color = {
-            "NEW": "gray",
-            "SCOPED": "orange",
-            "EXECUTING": "blue",
-            "PR_OPEN": "green",
-            "DONE": "green"
-        }.get(issue.status, "gray")
-        
-        st.caption(f"Current Status: **:{status_color}[{issue.status}]**")
-
-        if issue.status == "PR_OPEN" and issue.pr_url:
-            st.success(f"🚀 [View Pull Request]({issue.pr_url})")
-            
-            ci_badge = get_ci_badge(issue.ci_status or "unknown", issue.retry_count or 0)
-            st.markdown(f"**CI Status:** {ci_badge}")
-            
-            if st.button("🔄 Check CI Status", key=f"check_ci_{issue.id}", use_container_width=True):
-                with st.spinner("Checking CI status..."):
-                    ci_result = check_and_update_ci_status(issue, repo, db)
-                    if ci_result["status"] == "failing":
-                        st.warning(f"CI is failing! {len(ci_result.get('failures', []))} check(s) failed.")
-                        
-                        if (issue.retry_count or 0) < 3:
-                            st.markdown("**Auto-Healer Available**")
-                            if st.button("🔧 Auto-Heal (Retry Fix)", key=f"auto_heal_{issue.id}", type="primary"):
-                                heal_result = trigger_auto_heal(issue, repo, ci_result.get("failures", []), db)
-                                if "error" not in heal_result:
-                                    st.toast(f"🩹 Auto-Healing triggered for Issue #{issue.number}")
-                                    
-                                    st.info("Waiting 5 seconds before calling Devin (rate limiting)...")
-                                    time.sleep(5)
-                                    
-                                    task_runner = st.session_state.task_runner
-                                    plan_to_use = issue.scope_json or {}
-                                    task_runner.run_execute(
-                                        repo.url, issue.number, issue.title, plan_to_use,
-                                        ci_failure_context=heal_result.get("failure_context")
-                                    )
-                                    st.info(f"Auto-Healer triggered (Retry {heal_result['retry_count']}/3)")
-                                    time.sleep(1)
-                                    st.rerun()
-                                else:
-                                    st.error(heal_result["error"])
-                        else:
-                            st.error("Max retries (3) reached. Manual intervention required.")
-                    elif ci_result["status"] == "passing":
-                        st.success("All CI checks passed!")
-                    elif ci_result["status"] == "pending":
-                        st.info("CI checks still running...")
-                    st.rerun()
-        
-        st.markdown("---")
-
-        # Check if async task is running
-        task_runner = st.session_state.task_runner
-        
-        # Auto-check for task completion
-        if task_runner.status == "completed":
-            handle_task_completion(issue, task_runner, db)
-            st.rerun()
-        elif task_runner.status == "failed":
-            st.error(f"Task failed: {task_runner.error}")
-            task_runner.status = "idle"
-        
-        if task_runner.is_running():
-            st.info("🔄 Task in progress...")
-            progress = task_runner.get_progress()
-            st.progress(progress / 100)
-            
-            # Auto-refresh every 2 seconds while task is running
-            time.sleep(2)
-            st.rerun()
-        else:
-            # BUTTON: SCOPE (Planning)
-            if issue.status in ["NEW", "DONE"]:
-                if st.button("🔍 Start Scoping", key=f"scope_{issue.id}", type="primary", use_container_width=True):
-                    task_runner.run_scope(repo.url, issue.number, issue.title, issue.body, repo_id=repo.id)
-                    st.info("Scoping started in background...")
-                    time.sleep(1)
-                    st.rerun()
-
-            # BUTTON: EXECUTE (Coding)
-            if issue.status == "SCOPED":
-                plan_to_use = st.session_state.get('edited_plan') or issue.scope_json
-                
-                if st.button("🛠 Execute Fix", key=f"exec_{issue.id}", type="primary", use_container_width=True):
-                    task_runner.run_execute(repo.url, issue.number, issue.title, plan_to_use)
-                    st.info("Execution started in background...")
-                    time.sleep(1)
-                    st.rerun()
-                
-                if st.button("🔄 Re-Scope (Discard Plan)", key=f"rescope_{issue.id}", use_container_width=True):
-                    issue.status = "NEW"
-                    issue.scope_json = None
-                    issue.confidence = 0
-                    st.session_state.edited_plan = None
-                    db.commit()
-                    invalidate_cache()
-                    st.rerun()
-
-            # BUTTON: MARK AS CLOSED
-            st.markdown("---")
-            st.markdown("**Manual Controls**")
-            
-            if issue.status != "DONE":
-                col_close1, col_close2 = st.columns(2)
-                with col_close1:
-                    if st.button("✅ Close Locally Only", key=f"close_local_{issue.id}", use_container_width=True):
-                        result = close_issue_workflow(issue, repo, db, close_on_github=False)
-                        st.success(f"Issue #{issue.number} marked as closed locally!")
-                        invalidate_cache()
-                        time.sleep(1)
-                        st.rerun()
-                
-                with col_close2:
-                    if st.button("✅ Close on GitHub", key=f"close_gh_{issue.id}", use_container_width=True):
-                        st.session_state.show_close_confirm = issue.id
-            
-            if st.session_state.get('show_close_confirm') == issue.id:
-                st.warning(f"Close issue #{issue.number} on GitHub?")
-                st.caption("This will also close the issue remotely on GitHub.")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("Confirm Close on GitHub", key=f"confirm_close_{issue.id}", type="primary"):
-                        result = close_issue_workflow(issue, repo, db, close_on_github=True)
-                        st.session_state.show_close_confirm = None
-                        
-                        if result["success"]:
-                            st.success(f"Issue #{issue.number} closed on GitHub!")
-                            invalidate_cache()
-                            time.sleep(1)
-                            st.rerun()
-                        else:
-                            if result["error_type"] == "permission_denied":
-                                st.error(result["error_message"])
-                                st.info("💡 Tip: The issue was closed locally. To close on GitHub, generate a new token with 'repo' scope.")
-                            else:
-                                st.warning(f"Local status updated, but GitHub close failed: {result['error_message']}")
-                            invalidate_cache()
-                            time.sleep(2)
-                            st.rerun()
-                with col2:
-                    if st.button("Cancel", key=f"cancel_close_{issue.id}"):
-                        st.session_state.show_close_confirm = None
-                        st.rerun()
-
-            # BUTTON: RESET
-            st.markdown("---")
-            if st.button("🗑 Reset Issue State", key=f"reset_{issue.id}", use_container_width=True):
-                issue.status = "NEW"
-                issue.scope_json = None
-                issue.confidence = None
-                issue.pr_url = None
-                st.session_state.edited_plan = None
-                db.commit()
-                invalidate_cache()
-                st.rerun()
-
-
 def render_plan_display(plan: dict):
     """Display the action plan in a readable format."""
     st.markdown("**Strategy:**")
@@ -1803,26 +1900,35 @@ def render_plan_editor(issue, db):
     with st.expander("📋 View & Edit Action Plan", expanded=True):
         st.info("💡 **Cost Control:** Edit the plan below before executing to ensure Devin follows your preferred approach.")
         
-        current_plan = st.session_state.get('edited_plan') or issue.scope_json
+        current_plan = st.session_state.get('edited_plan') or issue.scope_json or {}
         
-        plan_json_str = json.dumps(current_plan, indent=2)
+        st.markdown("**Action Steps**")
+        edited_steps = st.data_editor(
+            pd.DataFrame({"step": [str(step) for step in current_plan.get("action_plan", [])]}, dtype="string"),
+            num_rows="dynamic",
+            use_container_width=True,
+            hide_index=True,
+            key=f"plan_steps_{issue.id}"
+        )
         
-        edited_json = st.text_area(
-            "Edit Plan JSON:",
-            value=plan_json_str,
-            height=300,
-            key=f"plan_editor_{issue.id}"
+        st.markdown("**Files to Change**")
+        edited_files = st.data_editor(
+            pd.DataFrame({"file": [str(f) for f in current_plan.get("files_to_change", [])]}, dtype="string"),
+            num_rows="dynamic",
+            use_container_width=True,
+            hide_index=True,
+            key=f"plan_files_{issue.id}"
         )
         
         col1, col2 = st.columns(2)
         with col1:
             if st.button("💾 Save Edited Plan", key=f"save_plan_{issue.id}"):
-                try:
-                    parsed_plan = json.loads(edited_json)
-                    st.session_state.edited_plan = parsed_plan
-                    st.success("Plan saved! Click 'Execute Fix' to use this plan.")
-                except json.JSONDecodeError as e:
-                    st.error(f"Invalid JSON: {e}")
+                st.session_state.edited_plan = {
+                    **{k: v for k, v in current_plan.items() if k not in ("action_plan", "files_to_change")},
+                    "action_plan": [s for s in edited_steps["step"].dropna().str.strip() if s],
+                    "files_to_change": [f for f in edited_files["file"].dropna().str.strip() if f],
+                }
+                st.success("Plan saved! Click 'Execute Fix' to use this plan.")
         
         with col2:
             if st.button("↩️ Reset to Original", key=f"reset_plan_{issue.id}"):
@@ -1855,8 +1961,7 @@ def render_interrogation_room(issue, repo, db):
             else:
                 with st.spinner("👮 Interrogating Devin with your feedback... (1-3 minutes)"):
                     try:
-                        cfg = load_config()
-                        client = DevinClient(cfg)
+                        client = get_devin_client()
                         
                         new_plan = client.start_rescope_session(
                             repo.url,
@@ -1870,12 +1975,11 @@ def render_interrogation_room(issue, repo, db):
                         issue.scope_json = new_plan
                         issue.confidence = new_plan.get("confidence", 0)
                         db.commit()
-                        invalidate_cache()
+                        invalidate_issues(repo.id)
                         
-                        st.success("Plan refined successfully!")
+                        queue_toast("Plan refined successfully!", icon="✅")
                         if new_plan.get("refinement_applied"):
-                            st.info(f"📝 {new_plan['refinement_applied']}")
-                        time.sleep(1)
+                            queue_toast(new_plan["refinement_applied"], icon="📝")
                         st.rerun()
                         
                     except Exception as e:
@@ -1883,57 +1987,48 @@ def render_interrogation_room(issue, repo, db):
                         logger.error(f"Interrogation failed for issue #{issue.number}: {e}")
 
 
-def handle_task_completion(issue, task_runner, db):
-    """Handle completion of async scope/execute tasks."""
+def handle_task_completion(task_runner):
+    """Announce a finished async scope/execute task; the worker already saved its result."""
     if task_runner.result:
-        if 'pr_url' in task_runner.result:
-            issue.status = "PR_OPEN"
-            issue.pr_url = task_runner.result.get("pr_url")
-            logger.info(f"PR created for issue #{issue.number}: {issue.pr_url}")
-            st.toast("🚀 PR Created Successfully!", icon="🔥")
+        if task_runner.task_type == "execute":
+            queue_toast("🚀 PR Created Successfully!", icon="🔥")
         else:
-            issue.scope_json = task_runner.result
-            issue.confidence = task_runner.result.get("confidence", 0)
-            issue.status = "SCOPED"
-            logger.info(f"Scoping completed for issue #{issue.number}")
-            st.toast("✅ Scoping Complete!", icon="🎉")
-        
-        db.commit()
-        invalidate_cache()
+            queue_toast("✅ Scoping Complete!", icon="🎉")
+        invalidate_issues(task_runner.repo_id)
     
     task_runner.status = "idle"
     task_runner.result = None
 
 
-def close_issue_workflow(issue, repo, db, close_on_github: bool = False) -> Dict[str, Any]:
+# GitHub failures after which the local close still stands: the token can't
+# close remotely, or the issue is gone there. Anything else leaves it open.
+LOCAL_CLOSE_ERRORS = {"permission_denied", "not_found"}
+
+def close_issues_bulk(issues, repo, db, close_on_github: bool = False) -> List[Dict[str, Any]]:
     """
-    Close an issue locally and optionally on GitHub.
-    Returns dict with 'success', 'local_closed', 'github_closed', 'error_message'.
+    Close several issues of one repo locally and optionally on GitHub.
+    GitHub is called first (the PATCHes run concurrently); the local close is then one UPDATE and one commit
+    for the whole batch, skipping issues whose remote close failed transiently.
+    Returns one result dict per issue (see close_issue_workflow).
     """
-    issue.status = "DONE"
-    issue.state = "closed"
-    db.commit()
-    logger.info(f"Issue #{issue.number} marked as closed locally")
-    
-    result = {
-        "success": True,
-        "local_closed": True,
-        "github_closed": False,
-        "error_message": None,
-        "error_type": None
-    }
+    results = [
+        {"success": True, "local_closed": False, "github_closed": False, "error_message": None, "error_type": None}
+        for _ in issues
+    ]
     
     if close_on_github:
-        try:
-            cfg = load_config()
-            gh = GitHubClient(cfg)
+        match = GITHUB_URL_RE.search(repo.url)
+        if match:
+            owner, repo_name = match.groups()
+            try:
+                gh_results = get_github_client().close_issues_bulk(
+                    owner, repo_name, [issue.number for issue in issues]
+                )
+            except Exception as e:
+                logger.error(f"Failed to close issues on GitHub: {e}")
+                gh_results = [{"success": False, "message": str(e), "error_type": "unknown"}] * len(issues)
             
-            match = re.search(r"github\.com/([^/]+)/([^/]+)", repo.url)
-            if match:
-                owner, repo_name = match.groups()
-                repo_name = repo_name.replace(".git", "")
-                gh_result = gh.close_issue(owner, repo_name, issue.number)
-                
+            for issue, result, gh_result in zip(issues, results, gh_results):
                 if gh_result["success"]:
                     logger.info(f"Issue #{issue.number} closed on GitHub")
                     result["github_closed"] = True
@@ -1941,13 +2036,28 @@ def close_issue_workflow(issue, repo, db, close_on_github: bool = False) -> Dict
                     result["success"] = False
                     result["error_message"] = gh_result["message"]
                     result["error_type"] = gh_result["error_type"]
-        except Exception as e:
-            logger.error(f"Failed to close issue on GitHub: {e}")
-            result["success"] = False
-            result["error_message"] = str(e)
-            result["error_type"] = "unknown"
     
-    return result
+    to_close = [
+        issue.id for issue, result in zip(issues, results)
+        if result["error_type"] is None or result["error_type"] in LOCAL_CLOSE_ERRORS
+    ]
+    if to_close:
+        db.execute(update(Issue).where(Issue.id.in_(to_close)).values(status="DONE", state="closed"))
+        db.commit()
+        for issue, result in zip(issues, results):
+            if issue.id in to_close:
+                result["local_closed"] = True
+                logger.info(f"Issue #{issue.number} marked as closed locally")
+    
+    return results
+
+
+def close_issue_workflow(issue, repo, db, close_on_github: bool = False) -> Dict[str, Any]:
+    """
+    Close an issue locally and optionally on GitHub.
+    Returns dict with 'success', 'local_closed', 'github_closed', 'error_message'.
+    """
+    return close_issues_bulk([issue], repo, db, close_on_github)[0]
 
 
 # --- LEGACY ACTION HANDLERS (kept for compatibility) ---
@@ -1955,8 +2065,7 @@ def run_scope_action(repo, issue, db):
     """Handles calling Devin to SCOPE an issue."""
     try:
         with st.spinner("🤖 Devin is analyzing the codebase... (30-60s)"):
-            cfg = load_config()
-            client = DevinClient(cfg)
+            client = get_devin_client()
             
             plan = client.start_scope_session(
                 repo.url,
@@ -1969,10 +2078,9 @@ def run_scope_action(repo, issue, db):
             issue.confidence = plan.get("confidence", 0)
             issue.status = "SCOPED"
             db.commit()
-            invalidate_cache()
+            invalidate_issues(repo.id)
         
-        st.toast("✅ Scoping Complete!", icon="🎉")
-        time.sleep(1)
+        queue_toast("✅ Scoping Complete!", icon="🎉")
         st.rerun()
 
     except Exception as e:
@@ -1985,8 +2093,7 @@ def run_execute_action(repo, issue, db):
         plan_to_use = st.session_state.get('edited_plan') or issue.scope_json
         
         with st.spinner("👨‍💻 Devin is coding, testing, and pushing... (2-5 mins)"):
-            cfg = load_config()
-            client = DevinClient(cfg)
+            client = get_devin_client()
             
             result = client.start_execute_session(
                 repo.url,
@@ -1999,16 +2106,35 @@ def run_execute_action(repo, issue, db):
             issue.pr_url = result.get("pr_url")
             st.session_state.edited_plan = None
             db.commit()
-            invalidate_cache()
+            invalidate_issues(repo.id)
         
-        st.toast("🚀 PR Created Successfully!", icon="🔥")
-        time.sleep(1)
+        queue_toast("🚀 PR Created Successfully!", icon="🔥")
         st.rerun()
 
     except Exception as e:
         st.error(f"Execution Failed: {str(e)}")
 
 
+TODO_TAG_COLORS = {"TODO": "blue", "FIXME": "red", "XXX": "orange", "HACK": "orange", "BUG": "red"}
+
+def _md_cell(text: str) -> str:
+    """Escape pipes so free text can sit inside a markdown table cell."""
+    return text.replace("|", "\\|")
+
+def build_todo_issue(todo: Dict[str, Any]) -> tuple:
+    """Return the (title, body) of the GitHub issue filed for a scanned TODO."""
+    title = f"Refactor: {todo['comment'][:50]}..."
+    body = (
+        f"**Tech Debt Found by Sheriff**\n\n"
+        f"**Type:** {todo['tag']}\n"
+        f"**File:** `{todo['file']}`\n"
+        f"**Line:** {todo['line']}\n\n"
+        f"**Comment:**\n```\n{todo['comment']}\n```\n\n"
+        f"---\n*Created by Devin Sheriff's Wanted List scanner*"
+    )
+    return title, body
+
+
 def render_wanted_tab(selected_repo):
     """Render the Wanted List (Tech Debt Scanner) tab."""
     st.subheader("📜 The Wanted List - Tech Debt Scanner")
@@ -2026,67 +2152,85 @@ def render_wanted_tab(selected_repo):
         scan_button = st.button("🔍 Scan for TODOs", type="primary", use_container_width=True)
     
     if scan_button:
-        with st.spinner("Scanning repository for tech debt..."):
-            todos = scan_for_todos(repo_path)
-            st.session_state.wanted_todos = todos
-            st.session_state.wanted_scanned_path = repo_path
+        progress = st.progress(0.0, text="Scanning repository for tech debt...")
+        todos = cached_scan_for_todos(
+            repo_path,
+            _on_progress=lambda done, total: progress.progress(
+                done / total, text=f"Scanning repository for tech debt... ({done}/{total})"
+            ),
+        )
+        progress.empty()
+        st.session_state.wanted_todos = todos
+        st.session_state.wanted_scanned_path = repo_path
     
     if 'wanted_todos' in st.session_state and st.session_state.wanted_todos:
         todos = st.session_state.wanted_todos
         
         st.success(f"Found {len(todos)} tech debt items!")
         
-        tag_counts = {}
-        for t in todos:
-            tag_counts[t['tag']] = tag_counts.get(t['tag'], 0) + 1
+        tag_counts = Counter(t['tag'] for t in todos)
         
         cols = st.columns(len(tag_counts))
-        for i, (tag, count) in enumerate(tag_counts.items()):
+        for i, (tag, count) in enumerate(tag_counts.most_common()):
             cols[i].metric(tag, count)
         
         st.markdown("---")
         
-        for idx, todo in enumerate(todos[:50]):
-            with st.container():
-                col1, col2, col3 = st.columns([3, 1, 1])
-                
-                with col1:
-                    tag_color = {"TODO": "blue", "FIXME": "red", "XXX": "orange", "HACK": "orange", "BUG": "red"}.get(todo['tag'], "gray")
-                    st.markdown(f"**:{tag_color}[{todo['tag']}]** `{todo['file']}:{todo['line']}`")
-                    st.caption(todo['comment'])
-                
-                with col2:
-                    st.caption(f"Line {todo['line']}")
-                
-                with col3:
-                    if st.button("⭐ Create Issue", key=f"create_issue_{idx}", use_container_width=True):
-                        title = f"Refactor: {todo['comment'][:50]}..."
-                        body = (
-                            f"**Tech Debt Found by Sheriff**\n\n"
-                            f"**Type:** {todo['tag']}\n"
-                            f"**File:** `{todo['file']}`\n"
-                            f"**Line:** {todo['line']}\n\n"
-                            f"**Comment:**\n```\n{todo['comment']}\n```\n\n"
-                            f"---\n*Created by Devin Sheriff's Wanted List scanner*"
-                        )
-                        
-                        try:
-                            cfg = load_config()
-                            gh = GitHubClient(cfg)
-                            result = gh.create_issue(selected_repo.owner, selected_repo.name, title, body)
-                            
-                            if result["success"]:
-                                st.toast(f"Issue #{result['issue_number']} created!", icon="⭐")
-                                sync_repo_issues(selected_repo.url)
-                                invalidate_cache()
-                                time.sleep(1)
-                                st.rerun()
-                            else:
-                                st.error(result["error"])
-                        except Exception as e:
-                            st.error(f"Failed to create issue: {e}")
+        shown = todos[:50]
+        
+        # One markdown table for the whole list instead of a container per row
+        rows = ["| Tag | Location | Comment |", "| --- | --- | --- |"]
+        rows += [
+            f"| **:{TODO_TAG_COLORS.get(t['tag'], 'gray')}[{t['tag']}]** "
+            f"| `{t['file']}:{t['line']}` "
+            f"| {_md_cell(t['comment'])} |"
+            for t in shown
+        ]
+        st.markdown("\n".join(rows))
+        
+        st.markdown("---")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            selected_idxs = st.multiselect(
+                "Create issues for…",
+                range(len(shown)),
+                format_func=lambda i: f"{shown[i]['tag']} {shown[i]['file']}:{shown[i]['line']} - {shown[i]['comment'][:60]}",
+                key="wanted_selected"
+            )
+        with col2:
+            st.write("")
+            create_clicked = st.button(
+                f"⭐ Create {len(selected_idxs)} Issue{'s' if len(selected_idxs) != 1 else ''}",
+                disabled=not selected_idxs, use_container_width=True
+            )
+        
+        if create_clicked and selected_idxs:
+            drafts = [build_todo_issue(shown[i]) for i in selected_idxs]
+            
+            try:
+                gh = get_github_client()
+                if len(drafts) == 1:
+                    results = [gh.create_issue(selected_repo.owner, selected_repo.name, *drafts[0])]
+                else:
+                    # One GraphQL mutation (per batch) instead of N REST calls
+                    results = gh.create_issues(selected_repo.owner, selected_repo.name, drafts)
                 
-                st.markdown("---")
+                created = [r for r in results if r["success"]]
+                failed = [r for r in results if not r["success"]]
+                if created:
+                    numbers = ", ".join(f"#{r['issue_number']}" for r in created)
+                    sync_repo_issues(selected_repo.url)
+                    invalidate_issues(selected_repo.id)
+                for r in failed:
+                    st.error(r["error"])
+                if created and not failed:
+                    queue_toast(f"Created {numbers}!", icon="⭐")
+                    del st.session_state["wanted_selected"]
+                    st.rerun()
+                elif created:
+                    st.toast(f"Created {numbers}!", icon="⭐")
+            except Exception as e:
+                st.error(f"Failed to create issue: {e}")
         
         if len(todos) > 50:
             st.info(f"Showing first 50 of {len(todos)} items. Clean up some tech debt!")
@@ -2110,9 +2254,7 @@ def render_tribunal_section(issue, repo):
         if st.button("⚖️ Convene Tribunal", type="secondary", use_container_width=True):
             with st.spinner("The Tribunal is reviewing the plan..."):
                 try:
-                    cfg = load_config()
-                    client = DevinClient(cfg)
-                    result = client.start_tribunal_session(issue.scope_json)
+                    result = tribunal_for_plan(plan_hash(issue.scope_json), issue.scope_json)
                     st.session_state.tribunal_result = result
                 except Exception as e:
                     st.error(f"Tribunal failed: {e}")
@@ -2120,7 +2262,7 @@ def render_tribunal_section(issue, repo):
     if st.session_state.tribunal_result:
         result = st.session_state.tribunal_result
         
-        if "error" in result and result.get("grade") == "?":
+        if "error" in result:
             st.error(f"Tribunal error: {result.get('error')}")
         else:
             grade = result.get("grade", "?")
@@ -2146,6 +2288,7 @@ def render_tribunal_section(issue, repo):
                 st.warning("⚠️ **Tribunal advises against execution.** Consider refining the plan first.")
             
             if st.button("🔄 Clear Tribunal Result"):
+                tribunal_for_plan.clear(plan_hash(issue.scope_json), None)
                 st.session_state.tribunal_result = None
                 st.rerun()
 
@@ -1,15 +1,19 @@
 import httpx
 import json
+import os
 import time
-import re
 import logging
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from .config import AppConfig, CONFIG_DIR
 
 # --- LOGGING SETUP ---
 logger = logging.getLogger("devin_client")
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 
 # --- GOVERNANCE RULES FILE ---
 RULES_FILE = CONFIG_DIR / "sheriff_rules.md"
@@ -25,25 +29,290 @@ These rules are automatically injected into all Devin prompts.
 5. Tests should be updated when modifying core logic.
 """
 
+@functools.lru_cache(maxsize=1)
+def _rules_cached(mtime_ns: int) -> str:
+    """Read the rules file once per modification time."""
+    return RULES_FILE.read_text()
+
 def load_governance_rules() -> str:
     """Load governance rules from file, creating default if missing."""
-    if not RULES_FILE.exists():
+    try:
+        mtime_ns = RULES_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         RULES_FILE.parent.mkdir(parents=True, exist_ok=True)
         RULES_FILE.write_text(DEFAULT_RULES)
         logger.info(f"Created default governance rules at {RULES_FILE}")
-    return RULES_FILE.read_text()
+        mtime_ns = RULES_FILE.stat().st_mtime_ns
+    return _rules_cached(mtime_ns)
 
 def save_governance_rules(content: str) -> bool:
     """Save governance rules to file."""
     try:
         RULES_FILE.parent.mkdir(parents=True, exist_ok=True)
         RULES_FILE.write_text(content)
+        _rules_cached.cache_clear()
         logger.info(f"Saved governance rules to {RULES_FILE}")
         return True
     except Exception as e:
         logger.error(f"Failed to save governance rules: {e}")
         return False
 
+# --- POLLING BACKOFF ---
+POLL_BASE_DELAY = 0.5  # seconds before the first re-poll
+POLL_MAX_DELAY = 30.0  # cap for long-running sessions
+POLL_BATCH_WINDOW = 0.25  # polls due this soon ride along with the current batch
+EVENTS_CACHE_SIZE = 32  # sessions whose event history (and ETag) we keep
+# Server-side filter for the one event _extract_last_json needs; servers that
+# reject it (400/422) get the plain history from then on.
+LAST_ASSISTANT_EVENT_PARAMS = {"type": "assistant_message", "limit": 1, "order": "desc"}
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    """Seconds the server asked us to wait, if it sent a numeric Retry-After."""
+    value = resp.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+# --- STRUCTURED OUTPUT SCHEMAS ---
+# Devin fills a session's `structured_output` when the prompt gives it a schema,
+# which lets _extract_last_json skip the events fetch and free-text parsing.
+SCOPE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "files_to_change": {"type": "array", "items": {"type": "string"}},
+        "action_plan": {"type": "array", "items": {"type": "string"}},
+        "confidence": {"type": "integer", "minimum": 0, "maximum": 100}
+    },
+    "required": ["summary", "files_to_change", "action_plan", "confidence"]
+}
+
+RESCOPE_SCHEMA = {
+    **SCOPE_SCHEMA,
+    "properties": {**SCOPE_SCHEMA["properties"], "refinement_applied": {"type": "string"}},
+    "required": SCOPE_SCHEMA["required"] + ["refinement_applied"]
+}
+
+TRIBUNAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "grade": {"type": "string", "enum": ["A", "B", "C", "D", "F"]},
+        "safety_score": {"type": "integer", "minimum": 0, "maximum": 10},
+        "efficiency_score": {"type": "integer", "minimum": 0, "maximum": 10},
+        "completeness_score": {"type": "integer", "minimum": 0, "maximum": 10},
+        "critique": {"type": "string"},
+        "recommendations": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["grade", "safety_score", "efficiency_score", "completeness_score", "critique"]
+}
+
+EXECUTE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "pr_url": {"type": "string"},
+        "summary": {"type": "string"}
+    },
+    "required": ["pr_url", "summary"]
+}
+
+def _structured_output_section(schema: Dict[str, Any]) -> str:
+    """Prompt section asking Devin to keep its structured output in this schema."""
+    return (
+        "\n\n## STRUCTURED OUTPUT\n"
+        "Keep your structured output updated with your final answer, "
+        f"as a JSON object matching this schema:\n{json.dumps(schema)}\n"
+    )
+
+# --- JSON EXTRACTION ---
+# Built once at import; the schemas never change at runtime.
+_SCOPE_OUTPUT = _structured_output_section(SCOPE_SCHEMA)
+_RESCOPE_OUTPUT = _structured_output_section(RESCOPE_SCHEMA)
+_TRIBUNAL_OUTPUT = _structured_output_section(TRIBUNAL_SCHEMA)
+_EXECUTE_OUTPUT = _structured_output_section(EXECUTE_SCHEMA)
+
+def _compact_json(obj: Any) -> str:
+    """Serialize without indentation/whitespace to keep prompts small."""
+    return json.dumps(obj, separators=(",", ":"))
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _find_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the first JSON object embedded in free text.
+    Tries raw_decode at each '{' in turn, which parses linearly from that point
+    instead of backtracking across the whole message like a greedy regex.
+    """
+    start = content.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(content, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        start = content.find("{", start + 1)
+    return None
+
+def _last_assistant_json(events) -> Optional[Dict[str, Any]]:
+    """JSON object from the first assistant message in events that has one."""
+    for event in events:
+        if event.get("type") == "assistant_message":
+            content = event.get("message", {}).get("content", "")
+            logger.debug("Found assistant message, length: %d", len(content))
+            
+            # Try to find JSON block
+            result = _find_json_object(content)
+            if result is not None:
+                logger.debug("Successfully parsed JSON with keys: %s", list(result))
+                return result
+            logger.warning("No JSON object found in assistant message")
+    return None
+
+# --- ASYNC RUNTIME ---
+class _BackgroundLoop:
+    """
+    One asyncio loop on a daemon thread, shared by every DevinClient.
+    A long-lived loop (rather than asyncio.run per call) lets the
+    AsyncClient connection pool survive between calls and lets callers
+    on any thread overlap many in-flight sessions.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="devin-client-loop", daemon=True).start()
+            return self._loop
+
+    def run(self, coro):
+        """Run a coroutine on the loop and block the calling thread for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+_LOOP = _BackgroundLoop()
+
+def gather_sessions(coros) -> List[Any]:
+    """
+    Run several session coroutines (e.g. client.astart_scope_session(...))
+    concurrently and return their results in order. Failures are returned
+    as exception objects instead of cancelling the other sessions.
+    """
+    async def _gather():
+        return await asyncio.gather(*coros, return_exceptions=True)
+    return _LOOP.run(_gather())
+
+class _SessionPoller:
+    """
+    Waits on every running session of one DevinClient from a single task.
+    Each tick GETs all sessions that are due in one asyncio.gather, resolves
+    the waiters whose session ended, then sleeps until the next one is due.
+    Every session keeps its own backoff from POLL_BASE_DELAY to POLL_MAX_DELAY,
+    so short sessions are noticed quickly and long ones cost few requests.
+    """
+
+    FINISHED = ("stopped", "completed", "terminated", "blocked", "finished")
+
+    def __init__(self, client: "DevinClient"):
+        self._client = client
+        # session_id -> {"future", "due", "deadline", "attempt", "timeout"}
+        self._waiting: Dict[str, Dict[str, Any]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait(self, session_id: str, timeout_seconds: float) -> Dict[str, Any]:
+        """Resolve with the session's final data once it stops."""
+        now = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[session_id] = {
+            "future": future, "due": now, "deadline": now + timeout_seconds,
+            "attempt": 0, "timeout": timeout_seconds,
+        }
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        try:
+            return await future
+        finally:
+            self._waiting.pop(session_id, None)
+
+    def _resolve(self, session_id: str, result=None, error: Optional[BaseException] = None):
+        waiter = self._waiting.pop(session_id, None)
+        if waiter is None or waiter["future"].done():
+            return
+        if error is not None:
+            waiter["future"].set_exception(error)
+        else:
+            waiter["future"].set_result(result)
+
+    async def _run(self):
+        try:
+            while self._waiting:
+                now = time.monotonic()
+                for session_id, waiter in list(self._waiting.items()):
+                    if now >= waiter["deadline"]:
+                        self._resolve(session_id, error=TimeoutError(
+                            f"Devin session {session_id} timed out after {waiter['timeout']}s"))
+                due = [sid for sid, w in self._waiting.items() if w["due"] <= now + POLL_BATCH_WINDOW]
+                if due:
+                    await asyncio.gather(*(self._poll(sid) for sid in due))
+                if not self._waiting:
+                    break
+
+                next_due = min(min(w["due"], w["deadline"]) for w in self._waiting.values())
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), max(0.0, next_due - time.monotonic()))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._task = None
+
+    async def _poll(self, session_id: str):
+        waiter = self._waiting.get(session_id)
+        if waiter is None:
+            return
+        delay = None
+        try:
+            resp = await self._client._http.get(f"/sessions/{session_id}")
+            if resp.status_code == 429:
+                delay = _retry_after(resp)
+                logger.warning(f"Rate limited while polling {session_id}, backing off")
+            else:
+                resp.raise_for_status()
+                data = resp.json()
+                
+                # Safely handle if status_enum is None
+                status = (data.get("status_enum") or "").lower()
+                
+                if status in self.FINISHED:
+                    logger.info(f"✅ Session {session_id} finished with status: {status}")
+                    self._resolve(session_id, result=data)
+                    return
+                
+                if status == "error":
+                    self._resolve(session_id, error=Exception(f"Devin Session Error: {data}"))
+                    return
+                
+                delay = _retry_after(resp)
+        except httpx.RequestError as e:
+            logger.warning(f"Network glitch, retrying: {e}")
+            waiter["attempt"] = 0
+        except Exception as e:
+            self._resolve(session_id, error=e)
+            return
+
+        if delay is None:
+            delay = min(POLL_MAX_DELAY, POLL_BASE_DELAY * 2 ** waiter["attempt"])
+        waiter["attempt"] += 1
+        waiter["due"] = time.monotonic() + delay
+
 class DevinClient:
     def __init__(self, config: AppConfig):
         self.api_key = config.devin_api_key
@@ -52,92 +321,117 @@ class DevinClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
-        self.governance_rules = load_governance_rules()
+        # Pooled HTTP/2 client, reused by every session call on the background loop.
+        # Polls and event fetches multiplex over one kept-alive connection.
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
+        self._poller = _SessionPoller(self)
+        # (session_id, filtered) -> (ETag, events); only touched from the background loop
+        self._events_cache: "OrderedDict[Tuple[str, bool], Tuple[Optional[str], List[Dict[str, Any]]]]" = OrderedDict()
+        self._events_filter_supported = True
 
-    def verify_auth(self) -> bool:
+    def close(self):
+        """Close the pooled HTTP client. The instance can't be used afterwards."""
+        _LOOP.run(self._http.aclose())
+
+    @property
+    def governance_rules(self) -> str:
+        """Current rules text; re-read only when the rules file changes."""
+        return load_governance_rules()
+
+    async def averify_auth(self) -> bool:
         """Checks if the API key works by listing sessions (limit 1)."""
         try:
-            with httpx.Client(timeout=10.0) as client:
-                resp = client.get(f"{self.base_url}/sessions", headers=self.headers, params={"limit": 1})
-                resp.raise_for_status()
-                return True
+            resp = await self._http.get("/sessions", params={"limit": 1}, timeout=10.0)
+            resp.raise_for_status()
+            return True
         except Exception as e:
             logger.error(f"Devin Auth Failed: {e}")
             return False
 
-    def _wait_for_session(self, session_id: str, timeout_seconds=300) -> Dict[str, Any]:
-        """Polls the session until it stops or completes."""
-        start_time = time.time()
-        
+    def verify_auth(self) -> bool:
+        """Blocking wrapper around averify_auth, on the shared pooled client."""
+        return _LOOP.run(self.averify_auth())
+
+    async def _wait_for_session(self, session_id: str, timeout_seconds=300) -> Dict[str, Any]:
+        """
+        Wait until the session stops or completes. Polling happens in the
+        client's shared _SessionPoller, batched with any other running sessions.
+        """
         logger.info(f"⏳ Waiting for Session {session_id} (Timeout: {timeout_seconds}s)...")
-        
-        with httpx.Client(timeout=30.0) as client:
-            while time.time() - start_time < timeout_seconds:
-                try:
-                    resp = client.get(f"{self.base_url}/sessions/{session_id}", headers=self.headers)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    
-                    # Safely handle if status_enum is None
-                    raw_status = data.get("status_enum")
-                    status = (raw_status or "").lower() 
-                    
-                    if status in ["stopped", "completed", "terminated", "blocked", "finished"]:
-                        logger.info(f"✅ Session {session_id} finished with status: {status}")
-                        return data
-                    
-                    if status == "error":
-                         raise Exception(f"Devin Session Error: {data}")
-                    
-                except httpx.RequestError as e:
-                    logger.warning(f"Network glitch, retrying: {e}")
-
-                time.sleep(5) # Poll every 5 seconds
-                
-        raise TimeoutError(f"Devin session {session_id} timed out after {timeout_seconds}s")
+        return await self._poller.wait(session_id, timeout_seconds)
+
+    async def _fetch_events(self, session_id: str, params: Optional[Dict[str, Any]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Event history of a session (or the subset selected by params), revalidated
+        with If-None-Match so an unchanged history is answered with a bodyless 304.
+        None on error.
+        """
+        key = (session_id, params is not None)
+        cached = self._events_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+
+        resp = await self._http.get(f"/sessions/{session_id}/events", params=params, headers=headers)
+        logger.debug("Fetched events for session %s, status: %d", session_id, resp.status_code)
+
+        if resp.status_code == 304 and cached:
+            self._events_cache.move_to_end(key)
+            return cached[1]
+        if params is not None and resp.status_code in (400, 422):
+            logger.info("Devin API rejected event filters, fetching full histories from now on")
+            self._events_filter_supported = False
+            return None
+        if resp.status_code != 200:
+            logger.error(f"Failed to fetch events: {resp.status_code}")
+            return None
+
+        events = resp.json()
+        self._events_cache[key] = (resp.headers.get("ETag"), events)
+        self._events_cache.move_to_end(key)
+        while len(self._events_cache) > EVENTS_CACHE_SIZE:
+            self._events_cache.popitem(last=False)
+        return events
 
-    def _extract_last_json(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _extract_last_json(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Digs through session history to find the JSON output we asked for.
         """
-        # 1. Try structured output if available (Future-proofing)
-        if "structured_output" in session_data and session_data["structured_output"]:
-            logger.info("Found structured_output in session data")
-            return session_data["structured_output"]
+        # 1. Expected path: structured output requested via the prompt schema
+        structured = session_data.get("structured_output")
+        if isinstance(structured, dict) and structured:
+            logger.debug("Found structured_output in session data")
+            return structured
 
-        # 2. Parse last assistant message
+        # 2. Fallback: parse the last assistant message
         session_id = session_data.get("session_id")
         if not session_id:
             logger.error("No session_id in session data")
             return {"error": "Invalid session data", "raw": session_data}
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.get(f"{self.base_url}/sessions/{session_id}/events", headers=self.headers)
-                logger.info(f"Fetched events for session {session_id}, status: {resp.status_code}")
-                
-                if resp.status_code == 200:
-                    events = resp.json()
-                    logger.info(f"Found {len(events)} events in session")
-                    
-                    # Look for the last message from 'assistant'
-                    for event in reversed(events):
-                        if event.get("type") == "assistant_message":
-                            content = event.get("message", {}).get("content", "")
-                            logger.info(f"Found assistant message, length: {len(content)}")
-                            
-                            # Try to find JSON block
-                            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-                            if json_match:
-                                try:
-                                    result = json.loads(json_match.group(0))
-                                    logger.info(f"Successfully parsed JSON with keys: {list(result.keys())}")
-                                    return result
-                                except json.JSONDecodeError as e:
-                                    logger.warning(f"JSON decode error: {e}")
-                                    continue
-                else:
-                    logger.error(f"Failed to fetch events: {resp.status_code}")
+            # Ask for just the last assistant message first, newest first. The
+            # answer is only trusted if the server honoured limit=1: a longer
+            # list may be in either order. Anything that doesn't yield a
+            # parseable assistant message falls back to the full history.
+            if self._events_filter_supported:
+                events = await self._fetch_events(session_id, LAST_ASSISTANT_EVENT_PARAMS)
+                if events and len(events) == 1:
+                    result = _last_assistant_json(events)
+                    if result is not None:
+                        return result
+
+            # The plain history is chronological, so scan it from the end
+            events = await self._fetch_events(session_id)
+            if events is not None:
+                logger.debug("Found %d events in session", len(events))
+                result = _last_assistant_json(reversed(events))
+                if result is not None:
+                    return result
         except Exception as e:
             logger.error(f"Error fetching events: {e}")
         
@@ -148,8 +442,14 @@ class DevinClient:
             "raw_debug": "Devin finished but didn't return strict JSON."
         }
 
-    def start_scope_session(self, repo_url: str, issue_number: int, title: str, body: str,
-                            similar_issues_context: Optional[str] = None):
+    async def _create_session(self, payload: Dict[str, Any]) -> str:
+        """POST a new session and return its id."""
+        resp = await self._http.post("/sessions", json=payload)
+        resp.raise_for_status()
+        return resp.json()["session_id"]
+
+    async def astart_scope_session(self, repo_url: str, issue_number: int, title: str, body: str,
+                                   similar_issues_context: Optional[str] = None):
         """
         Starts a Scope session. Timeout: 5 minutes.
         Optionally accepts similar_issues_context from The Archive feature.
@@ -172,32 +472,30 @@ class DevinClient:
             '  "confidence": 85\n'
             "}\n"
             "Return ONLY raw JSON. No markdown formatting."
-            f"{history_section}"
-            f"{governance_section}"
         )
 
-        user_message = f"Issue #{issue_number}: {title}\n\n{body}"
+        prompt = "".join((
+            system_prompt, _SCOPE_OUTPUT, history_section, governance_section,
+            f"\n\nTask: Issue #{issue_number}: {title}\n\n{body}",
+        ))
 
         payload = {
-            "prompt": f"{system_prompt}\n\nTask: {user_message}",
+            "prompt": prompt,
             "idempotent": True 
         }
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.post(f"{self.base_url}/sessions", json=payload, headers=self.headers)
-                resp.raise_for_status()
-                session_id = resp.json()["session_id"]
-                logger.info(f"🚀 Started Scope Session: {session_id}")
-                
-                final_data = self._wait_for_session(session_id, timeout_seconds=300)
-                return self._extract_last_json(final_data)
+            session_id = await self._create_session(payload)
+            logger.info(f"🚀 Started Scope Session: {session_id}")
+            
+            final_data = await self._wait_for_session(session_id, timeout_seconds=300)
+            return await self._extract_last_json(final_data)
         except Exception as e:
             logger.error(f"Scope Session Failed: {e}")
             raise e
 
-    def start_rescope_session(self, repo_url: str, issue_number: int, title: str, body: str, 
-                               previous_plan: dict, refinement_notes: str):
+    async def astart_rescope_session(self, repo_url: str, issue_number: int, title: str, body: str, 
+                                     previous_plan: dict, refinement_notes: str):
         """
         Re-scope an issue with user refinement notes.
         This passes the previous plan and user's feedback to generate a better plan.
@@ -208,7 +506,7 @@ class DevinClient:
             "You are a Senior Software Architect. Your goal is to RE-SCOPE a GitHub issue based on user feedback.\n"
             f"1. Clone the repository: {repo_url}\n"
             "2. Review the PREVIOUS PLAN that was generated:\n"
-            f"{json.dumps(previous_plan, indent=2)}\n\n"
+            f"{_compact_json(previous_plan)}\n\n"
             "3. The user has provided the following REFINEMENT NOTES:\n"
             f'"{refinement_notes}"\n\n'
             "4. Generate a NEW, IMPROVED plan that incorporates the user's feedback.\n"
@@ -221,30 +519,29 @@ class DevinClient:
             '  "refinement_applied": "Brief note on how user feedback was incorporated"\n'
             "}\n"
             "Return ONLY raw JSON. No markdown formatting."
-            f"{governance_section}"
         )
 
-        user_message = f"Issue #{issue_number}: {title}\n\n{body}"
+        prompt = "".join((
+            system_prompt, _RESCOPE_OUTPUT, governance_section,
+            f"\n\nOriginal Issue: Issue #{issue_number}: {title}\n\n{body}",
+        ))
 
         payload = {
-            "prompt": f"{system_prompt}\n\nOriginal Issue: {user_message}",
+            "prompt": prompt,
             "idempotent": True 
         }
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.post(f"{self.base_url}/sessions", json=payload, headers=self.headers)
-                resp.raise_for_status()
-                session_id = resp.json()["session_id"]
-                logger.info(f"🔄 Started Re-Scope Session: {session_id}")
-                
-                final_data = self._wait_for_session(session_id, timeout_seconds=300)
-                return self._extract_last_json(final_data)
+            session_id = await self._create_session(payload)
+            logger.info(f"🔄 Started Re-Scope Session: {session_id}")
+            
+            final_data = await self._wait_for_session(session_id, timeout_seconds=300)
+            return await self._extract_last_json(final_data)
         except Exception as e:
             logger.error(f"Re-Scope Session Failed: {e}")
             raise e
 
-    def start_tribunal_session(self, plan_json: dict) -> Dict[str, Any]:
+    async def astart_tribunal_session(self, plan_json: dict) -> Dict[str, Any]:
         """
         The Tribunal: A specialized AI step to grade the plan before execution.
         Returns a grade (A-F) and critique on Safety, Efficiency, and Completeness.
@@ -268,27 +565,29 @@ class DevinClient:
             "Grade scale: A (excellent), B (good), C (acceptable), D (risky), F (dangerous).\n"
             "Return ONLY raw JSON. No markdown formatting."
         )
-        
+
+        prompt = "".join((
+            system_prompt, _TRIBUNAL_OUTPUT,
+            "\n\nPLAN TO REVIEW:\n", _compact_json(plan_json),
+        ))
+
         payload = {
-            "prompt": f"{system_prompt}\n\nPLAN TO REVIEW:\n{json.dumps(plan_json, indent=2)}",
+            "prompt": prompt,
             "idempotent": True
         }
         
         try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.post(f"{self.base_url}/sessions", json=payload, headers=self.headers)
-                resp.raise_for_status()
-                session_id = resp.json()["session_id"]
-                logger.info(f"⚖️ Started Tribunal Session: {session_id}")
-                
-                final_data = self._wait_for_session(session_id, timeout_seconds=120)
-                return self._extract_last_json(final_data)
+            session_id = await self._create_session(payload)
+            logger.info(f"⚖️ Started Tribunal Session: {session_id}")
+            
+            final_data = await self._wait_for_session(session_id, timeout_seconds=120)
+            return await self._extract_last_json(final_data)
         except Exception as e:
             logger.error(f"Tribunal Session Failed: {e}")
             return {"error": str(e), "grade": "?"}
 
-    def start_execute_session(self, repo_url: str, issue_number: int, title: str, plan_json: dict,
-                              ci_failure_context: Optional[str] = None):
+    async def astart_execute_session(self, repo_url: str, issue_number: int, title: str, plan_json: dict,
+                                     ci_failure_context: Optional[str] = None):
         """
         Starts an Execution session. Timeout: 10 minutes.
         Optionally accepts ci_failure_context for Auto-Healer retries.
@@ -306,31 +605,48 @@ class DevinClient:
         system_prompt = (
             "You are a Senior DevOps Engineer. Your goal is to FIX a GitHub issue.\n"
             f"1. Clone the repository: {repo_url}\n"
-            f"2. Follow this APPROVED PLAN exactly:\n{json.dumps(plan_json)}\n"
+            f"2. Follow this APPROVED PLAN exactly:\n{_compact_json(plan_json)}\n"
             "3. Create a new branch, write the code, run tests to verify.\n"
             "4. Commit changes and push the branch.\n"
             f"5. Open a Pull Request. **IMPORTANT:** The PR description MUST include 'Closes #{issue_number}'.\n"
             "6. Return JSON: { \"pr_url\": \"...\", \"summary\": \"...\" }"
-            f"{ci_context}"
-            f"{governance_section}"
         )
 
+        prompt = "".join((
+            system_prompt, _EXECUTE_OUTPUT, ci_context, governance_section,
+            f"\n\nIssue #{issue_number}: {title}",
+        ))
+
         payload = {
-            "prompt": f"{system_prompt}\n\nIssue #{issue_number}: {title}",
+            "prompt": prompt,
             "idempotent": True
         }
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.post(f"{self.base_url}/sessions", json=payload, headers=self.headers)
-                resp.raise_for_status()
-                data = resp.json()
-                session_id = data["session_id"]
-                logger.info(f"🚀 Started Execute Session: {session_id}")
-                
-                # Wait for completion (10 min timeout for fixes)
-                final_data = self._wait_for_session(session_id, timeout_seconds=600)
-                return self._extract_last_json(final_data)
+            session_id = await self._create_session(payload)
+            logger.info(f"🚀 Started Execute Session: {session_id}")
+            
+            # Wait for completion (10 min timeout for fixes)
+            final_data = await self._wait_for_session(session_id, timeout_seconds=600)
+            return await self._extract_last_json(final_data)
         except Exception as e:
             logger.error(f"Execute Session Failed: {e}")
             raise e
+
+    # --- SYNC FACADES (block the calling thread on the shared loop) ---
+
+    def start_scope_session(self, *args, **kwargs):
+        """Blocking wrapper around astart_scope_session."""
+        return _LOOP.run(self.astart_scope_session(*args, **kwargs))
+
+    def start_rescope_session(self, *args, **kwargs):
+        """Blocking wrapper around astart_rescope_session."""
+        return _LOOP.run(self.astart_rescope_session(*args, **kwargs))
+
+    def start_tribunal_session(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around astart_tribunal_session."""
+        return _LOOP.run(self.astart_tribunal_session(*args, **kwargs))
+
+    def start_execute_session(self, *args, **kwargs):
+        """Blocking wrapper around astart_execute_session."""
+        return _LOOP.run(self.astart_execute_session(*args, **kwargs))
@@ -1,11 +1,286 @@
 import httpx
 import logging
-from typing import List, Dict, Any, Optional
+import orjson
+import functools
+import re
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple, Union
+from sqlalchemy import update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from .config import AppConfig
+from .models import SessionFactory, HttpCache
 
 # --- LOGGING SETUP ---
 logger = logging.getLogger("github_client")
-logging.basicConfig(level=logging.INFO)
+
+GRAPHQL_BATCH_SIZE = 20  # createIssue mutations aliased into one request
+RATE_LIMIT_MAX_WAIT = 60.0  # seconds; longer waits are surfaced instead
+RATE_LIMIT_RETRIES = 2
+FANOUT_WORKERS = 8  # threads for independent requests issued side by side
+# AIMD concurrency control: in-flight cap grows by ALPHA per success and
+# is multiplied by BETA whenever GitHub throttles us.
+RATE_LIMIT_ALPHA = 0.5
+RATE_LIMIT_BETA = 0.5
+RATE_LIMIT_RESERVE = 0.05  # pause until reset when this share of the quota is left
+ETAG_CACHE_SIZE = 1024  # GET responses kept for If-None-Match revalidation
+HTTP_CACHE_MAX_AGE = timedelta(days=7)  # persisted ETags unused for this long are pruned
+HTTP_CACHE_TOUCH_AGE = timedelta(days=1)  # a 304 refreshes fetched_at once the row is this old
+HTTP_CACHE_PRUNE_INTERVAL = 3600.0  # seconds between prunes within one process
+HOT_CACHE_SIZE = 2048  # memoized issue/PR/CI lookups per client
+HOT_CACHE_TTL = 60.0  # seconds an issue or PR lookup is reused without asking GitHub
+CI_CACHE_TTL = 15.0  # CI state moves faster, so keep it briefly
+REPO_CACHE_SIZE = 64  # memoized get_repo_details results per client
+SEARCH_CONCURRENCY = 2
+OPEN_ISSUES_TTL = 30.0  # seconds a repo's open-issue listing is reused across clients
+
+# (owner, repo) -> (expires_at, issues). Module-level because each sync builds
+# its own client, and back-to-back syncs from the UI list the same repo.
+_open_issues_cache: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+_open_issues_lock = threading.Lock()
+
+# monotonic time of this process's last http_cache prune; clients come and go
+# per sync, so pruning is gated here rather than run in every __init__
+_http_cache_pruned_at: Optional[float] = None
+_http_cache_prune_lock = threading.Lock()
+
+# http_cache writes never run on the request path: they are queued here
+# (url -> (etag, link, body), or None to only refresh fetched_at) and one
+# background thread flushes whatever has piled up in a single transaction,
+# so paginated fetches don't contend for SQLite's write lock. The worker
+# drains its queue at interpreter exit, so a CLI run still persists its ETags.
+_http_cache_writes: Dict[str, Optional[Tuple[str, Optional[str], Any]]] = {}
+_http_cache_write_lock = threading.Lock()
+_http_cache_flush_queued = False
+_HTTP_CACHE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="http-cache")
+
+# One Link entry, e.g. <https://api.github.com/...&page=2>; rel="next"
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="(\w+)"')
+
+def _links(resp: httpx.Response) -> Dict[str, str]:
+    """Map rel -> URL from the Link header. Cheaper than resp.links, which re-parses on every access."""
+    return {rel: url for url, rel in _LINK_RE.findall(resp.headers.get("Link", ""))}
+
+def _json(resp: httpx.Response) -> Any:
+    """Decode a response body with orjson, which is several times faster than stdlib json."""
+    return orjson.loads(resp.content)
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    """
+    Seconds GitHub asks us to back off, or None if this isn't a rate-limit response.
+    Honours Retry-After (secondary limits) and X-RateLimit-Reset (primary limit).
+    """
+    if resp.status_code not in (403, 429):
+        return None
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            return None
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            return max(0.0, float(resp.headers["X-RateLimit-Reset"]) - time.time())
+        except (KeyError, ValueError):
+            return None
+    return None
+
+def _hot_cached(kind: str, ttl: float, keep=lambda value: value is not None):
+    """
+    Memoize a (owner, repo, number) lookup on the client for ttl seconds,
+    so bursts of UI reruns don't re-ask GitHub. Results failing keep() (errors)
+    are not stored. Cached values are shared, so treat them as read-only.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, owner: str, repo: str, number: int):
+            key = (kind, owner, repo, number)
+            with self._hot_lock:
+                hit = self._hot_cache.get(key)
+            if hit and hit[0] > time.monotonic():
+                return hit[1]
+
+            value = method(self, owner, repo, number)
+            if keep(value):
+                with self._hot_lock:
+                    self._hot_cache.pop(key, None)
+                    self._hot_cache[key] = (time.monotonic() + ttl, value)
+                    if len(self._hot_cache) > HOT_CACHE_SIZE:
+                        now = time.monotonic()
+                        for k in [k for k, (expires, _) in self._hot_cache.items() if expires <= now]:
+                            del self._hot_cache[k]
+                        while len(self._hot_cache) > HOT_CACHE_SIZE:
+                            del self._hot_cache[next(iter(self._hot_cache))]
+            return value
+        return wrapper
+    return decorator
+
+_CHECK_RUN_FAILED = frozenset(("failure", "cancelled"))
+_CHECK_RUN_PENDING = frozenset(("in_progress", "queued"))
+
+def _summarize_ci(combined_state: str, statuses: List[Dict[str, Any]],
+                  check_runs: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, str]]]:
+    """
+    Reduce commit statuses and check runs to (overall status, failures).
+    Each list is read once per field rather than branching per item.
+    """
+    states = [s.get("state") for s in statuses]
+    conclusions = [run.get("conclusion") for run in check_runs]
+
+    failures = [
+        {"name": s.get("context", "Unknown"), "description": s.get("description", "No description")}
+        for s, state in zip(statuses, states) if state == "failure"
+    ] + [
+        {"name": run.get("name", "Unknown"), "description": run.get("output", {}).get("summary", "Check failed")}
+        for run, conclusion in zip(check_runs, conclusions) if conclusion in _CHECK_RUN_FAILED
+    ]
+    if failures:
+        return "failing", failures
+
+    pending = "pending" in states or any(
+        run.get("status") in _CHECK_RUN_PENDING for run in check_runs
+    )
+    if pending:
+        return "pending", failures
+    if combined_state == "success" or (not statuses and not check_runs):
+        return "passing", failures
+    return combined_state, failures
+
+class GitHubRateLimiter:
+    """
+    Gates every request of one GitHubClient. Tracks the rate-limit headers on
+    each response: when GitHub throttles (Retry-After / exhausted quota) or the
+    quota runs low, new requests wait until the advertised time, and the
+    allowed concurrency adapts AIMD-style between 1 and max_concurrency.
+    """
+
+    def __init__(self, max_concurrency: int = FANOUT_WORKERS):
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self._in_flight = 0
+        self._blocked_until = 0.0  # time.monotonic() deadline
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self._cond:
+            while True:
+                wait = self._blocked_until - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                elif self._in_flight >= int(self.concurrency):
+                    self._cond.wait()
+                else:
+                    break
+            self._in_flight += 1
+
+    def release(self, resp: Optional[httpx.Response]):
+        """Return the slot and learn from the response headers."""
+        with self._cond:
+            self._in_flight -= 1
+            if resp is not None:
+                self._observe(resp)
+            self._cond.notify_all()
+
+    def _block_for(self, seconds: float):
+        if 0 < seconds <= RATE_LIMIT_MAX_WAIT:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def _observe(self, resp: httpx.Response):
+        wait = _retry_after(resp)
+        if wait is not None:
+            self.concurrency = max(1.0, self.concurrency * RATE_LIMIT_BETA)
+            logger.warning("GitHub rate limited, waiting %.0fs (concurrency now %d)", wait, int(self.concurrency))
+            self._block_for(wait)
+            return
+
+        if resp.is_success or resp.status_code == 304:
+            self.concurrency = min(float(self.max_concurrency), self.concurrency + RATE_LIMIT_ALPHA)
+
+        try:
+            remaining = int(resp.headers["X-RateLimit-Remaining"])
+            limit = int(resp.headers["X-RateLimit-Limit"])
+            reset = float(resp.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        if remaining <= limit * RATE_LIMIT_RESERVE:
+            logger.warning("GitHub quota low (%d/%d left), pausing until reset", remaining, limit)
+            self._block_for(reset - time.time())
+
+# The persisted cache is best effort: a locked or broken DB only costs a
+# full 200 response, so failures are logged and never raised. That covers
+# opening the session too, since the first one may run init_db().
+# SessionFactory (not SessionLocal) keeps these off any caller's session;
+# closing it rolls back anything left uncommitted.
+
+def _queue_http_cache_write(key: str, row: Optional[Tuple[str, Optional[str], Any]] = None):
+    """Queue a row to persist, or (row=None) a fetched_at refresh, for the writer thread."""
+    global _http_cache_flush_queued
+    with _http_cache_write_lock:
+        if row is not None or key not in _http_cache_writes:
+            _http_cache_writes[key] = row
+        if _http_cache_flush_queued:
+            return
+        _http_cache_flush_queued = True
+    _HTTP_CACHE_WRITER.submit(_flush_http_cache)
+
+def _flush_http_cache():
+    """Write every queued http_cache row and refresh in one transaction."""
+    global _http_cache_flush_queued
+    with _http_cache_write_lock:
+        pending = dict(_http_cache_writes)
+        _http_cache_writes.clear()
+        _http_cache_flush_queued = False
+    now = datetime.utcnow()
+    rows = [
+        {"url": key, "etag": row[0], "link": row[1], "body": row[2], "fetched_at": now}
+        for key, row in pending.items() if row is not None
+    ]
+    touched = [key for key, row in pending.items() if row is None]
+    try:
+        with SessionFactory() as db:
+            if rows:
+                stmt = sqlite_insert(HttpCache)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["url"],
+                    set_={name: stmt.excluded[name] for name in ("etag", "link", "body", "fetched_at")},
+                )
+                db.execute(stmt, rows)
+            if touched:
+                db.execute(update(HttpCache).where(HttpCache.url.in_(touched)).values(fetched_at=now))
+            db.commit()
+    except Exception as e:
+        logger.debug("HTTP cache write failed for %d entries: %s", len(pending), e)
+
+def _prune_http_cache():
+    """Drop rows unused for HTTP_CACHE_MAX_AGE. Runs on the writer thread."""
+    try:
+        with SessionFactory() as db:
+            cutoff = datetime.utcnow() - HTTP_CACHE_MAX_AGE
+            db.query(HttpCache).filter(HttpCache.fetched_at < cutoff).delete(synchronize_session=False)
+            db.commit()
+    except Exception as e:
+        logger.debug("HTTP cache prune failed: %s", e)
+
+def _schedule_http_cache_prune():
+    """Queue a prune on the writer thread, at most once per HTTP_CACHE_PRUNE_INTERVAL."""
+    global _http_cache_pruned_at
+    with _http_cache_prune_lock:
+        now = time.monotonic()
+        if _http_cache_pruned_at is not None and now - _http_cache_pruned_at < HTTP_CACHE_PRUNE_INTERVAL:
+            return
+        _http_cache_pruned_at = now
+    _HTTP_CACHE_WRITER.submit(_prune_http_cache)
+
+def _cached_response(key: str, etag: str, link: Optional[str]) -> httpx.Response:
+    """Bodyless stand-in for a cached 200: callers read the status, the Link header and the parsed body."""
+    headers = {"ETag": etag}
+    if link:
+        headers["Link"] = link
+    return httpx.Response(200, headers=headers, request=httpx.Request("GET", key))
 
 class GitHubClient:
     def __init__(self, config: AppConfig):
@@ -19,61 +294,199 @@ class GitHubClient:
         }
         self.base_url = "https://api.github.com"
         self.timeout = 10.0 # Seconds
+        # One pooled HTTP/2 client for every call, so requests multiplex over a
+        # kept-alive connection instead of paying a TCP+TLS handshake each time.
+        # httpx advertises every decoder it has (gzip, deflate, and br once
+        # brotli is installed), so JSON pages arrive compressed.
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        )
+        # httpx.Client is thread-safe; independent GETs fan out on this pool
+        self._pool = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="github-client")
+        self._limiter = GitHubRateLimiter()
+        # The search API has its own, much smaller quota (30 req/min), so it
+        # is tracked separately and never pauses the core REST calls
+        self._search_limiter = GitHubRateLimiter(max_concurrency=SEARCH_CONCURRENCY)
+        # full URL -> (ETag, Link header, parsed body), LRU order; the raw response
+        # isn't kept, so each page is held once. Backed by the http_cache table
+        # so a fresh process still revalidates with 304s.
+        self._etag_cache: "OrderedDict[str, Tuple[str, Optional[str], Any]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # keys loaded from http_cache whose fetched_at is past HTTP_CACHE_TOUCH_AGE;
+        # a 304 on one of them marks the row as still in use
+        self._touch_due: set = set()
+        _schedule_http_cache_prune()
+        # (kind, owner, repo, number) -> (expires_at, value); see _hot_cached
+        self._hot_cache: Dict[Tuple[str, str, str, int], Tuple[float, Any]] = {}
+        self._hot_lock = threading.Lock()
+        # Repo metadata (default branch, visibility) barely changes, so it is
+        # kept for the client's lifetime; see invalidate_repo(). Errors aren't cached.
+        self.get_repo_details = functools.lru_cache(maxsize=REPO_CACHE_SIZE)(self._fetch_repo_details)
+
+    def close(self):
+        """Close the pooled HTTP client. The instance can't be used afterwards."""
+        self._pool.shutdown(wait=False)
+        self._client.close()
+
+    def _request(self, method: str, url: Union[str, httpx.URL], **kwargs) -> httpx.Response:
+        """
+        Send one request through the rate limiter. Throttled responses with a
+        short advertised wait are retried; anything else is returned as-is.
+        """
+        limiter = self._search_limiter if httpx.URL(url).path.startswith("/search/") else self._limiter
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            limiter.acquire()
+            resp = None
+            try:
+                resp = self._client.request(method, url, **kwargs)
+            finally:
+                limiter.release(resp)
+            wait = _retry_after(resp)
+            if wait is None or wait > RATE_LIMIT_MAX_WAIT or attempt == RATE_LIMIT_RETRIES:
+                return resp
+        return resp
+
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[httpx.Response, Any]:
+        """
+        Conditional GET. Revalidates earlier responses with If-None-Match; a 304
+        (free against the rate limit, no body) returns a bodyless 200 view of the
+        stored response and its parsed body. Returns (response, body); body is
+        None unless status is 200.
+        Cached bodies are shared, so treat them as read-only.
+        """
+        # Resolve the absolute URL once: it is both the cache key and what gets sent
+        full_url = self._client.base_url.join(url)
+        if params:
+            full_url = full_url.copy_merge_params(params)
+        key = str(full_url)
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        if cached is None:
+            cached = self._load_http_cache(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        resp = self._request("GET", full_url, headers=headers)
+        if resp.status_code == 304 and cached:
+            self._remember(key, cached)
+            if key in self._touch_due:
+                self._touch_due.discard(key)
+                _queue_http_cache_write(key)
+            etag, link, data = cached
+            return _cached_response(key, etag, link), data
+        if resp.status_code != 200:
+            return resp, None
+
+        data = _json(resp)
+        etag = resp.headers.get("ETag")
+        if etag:
+            entry = (etag, resp.headers.get("Link"), data)
+            self._remember(key, entry)
+            _queue_http_cache_write(key, entry)
+        return resp, data
+
+    def _remember(self, key: str, entry: Tuple[str, Optional[str], Any]):
+        with self._etag_lock:
+            self._etag_cache[key] = entry
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
+    def _load_http_cache(self, key: str) -> Optional[Tuple[str, Optional[str], Any]]:
+        """Persisted (etag, link, body) for key, or None; see the notes on _flush_http_cache."""
+        try:
+            with SessionFactory() as db:
+                row = db.get(HttpCache, key)
+                if row is None:
+                    return None
+                if row.fetched_at is None or row.fetched_at < datetime.utcnow() - HTTP_CACHE_TOUCH_AGE:
+                    self._touch_due.add(key)
+                return row.etag, row.link, row.body
+        except Exception as e:
+            logger.debug("HTTP cache read failed for %s: %s", key, e)
+            return None
+
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        resp, data = self._cached_get(url, params)
+        resp.raise_for_status()
+        return data
+
+    def invalidate(self, owner: str, repo: str, number: int):
+        """Forget memoized lookups for one issue/PR number, e.g. after writing to it."""
+        with self._hot_lock:
+            for kind in ("issue", "pull", "ci"):
+                self._hot_cache.pop((kind, owner, repo, number), None)
+
+    def invalidate_repo(self, owner: str, repo: str):
+        """
+        Forget memoized repo details. lru_cache can't drop a single key, so this
+        clears every repo's entry; they are cheap to refetch.
+        """
+        self.get_repo_details.cache_clear()
+
+    def invalidate_open_issues(self, owner: str, repo: str):
+        """Forget the shared fetch_open_issues listing for a repo, e.g. after creating or closing an issue."""
+        with _open_issues_lock:
+            _open_issues_cache.pop((owner, repo), None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def verify_auth(self) -> str:
         """Checks if token is valid. Returns username if success."""
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(f"{self.base_url}/user", headers=self.headers)
-                response.raise_for_status()
-                username = response.json().get("login", "Unknown User")
-                logger.info(f"✅ GitHub Authenticated as: {username}")
-                return username
+            response = self._request("GET", "/user")
+            response.raise_for_status()
+            username = _json(response).get("login", "Unknown User")
+            logger.info("✅ GitHub Authenticated as: %s", username)
+            return username
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise Exception("GitHub Token is invalid (401 Unauthorized).")
             raise Exception(f"GitHub API Error: {e}")
         except Exception as e:
-            logger.error(f"Auth Check Failed: {e}")
+            logger.error("Auth Check Failed: %s", e)
             raise Exception(f"Connection Failed: {str(e)}")
 
     def get_rate_limit(self) -> Dict[str, Any]:
         """Check remaining API calls."""
-        with httpx.Client(timeout=self.timeout) as client:
-            resp = client.get(f"{self.base_url}/rate_limit", headers=self.headers)
-            resp.raise_for_status()
-            data = resp.json().get("rate", {})
-            return {
-                "limit": data.get("limit"),
-                "remaining": data.get("remaining"),
-                "reset": data.get("reset")
-            }
+        resp = self._request("GET", "/rate_limit")
+        resp.raise_for_status()
+        data = _json(resp).get("rate", {})
+        return {
+            "limit": data.get("limit"),
+            "remaining": data.get("remaining"),
+            "reset": data.get("reset")
+        }
 
-    def get_repo_details(self, owner: str, repo: str) -> Dict[str, Any]:
-        """Get basic repo info like default branch."""
-        url = f"{self.base_url}/repos/{owner}/{repo}"
+    def _fetch_repo_details(self, owner: str, repo: str) -> Dict[str, Any]:
+        """Get basic repo info like default branch. Use get_repo_details(), which memoizes this."""
+        url = f"/repos/{owner}/{repo}"
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.get(url, headers=self.headers)
-                resp.raise_for_status()
-                return resp.json()
+            return self._get_json(url)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 raise Exception(f"Repository '{owner}/{repo}' not found or private (check permissions).")
             raise e
 
+    @_hot_cached("issue", HOT_CACHE_TTL)
     def get_single_issue(self, owner: str, repo: str, issue_number: int) -> Optional[Dict[str, Any]]:
         """Fetch a specific issue to refresh its details."""
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}"
+        url = f"/repos/{owner}/{repo}/issues/{issue_number}"
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.get(url, headers=self.headers)
-                if resp.status_code == 404:
-                    return None
-                resp.raise_for_status()
-                return resp.json()
+            resp, data = self._cached_get(url)
+            if resp.status_code == 404:
+                return None
+            resp.raise_for_status()
+            return data
         except Exception as e:
-            logger.error(f"Failed to fetch issue #{issue_number}: {e}")
+            logger.error("Failed to fetch issue #%s: %s", issue_number, e)
             return None
 
     def close_issue(self, owner: str, repo: str, issue_number: int) -> Dict[str, Any]:
@@ -82,57 +495,78 @@ class GitHubClient:
         Returns a dict with 'success' bool and 'error_type' if failed.
         error_type can be: 'permission_denied', 'not_found', 'unknown'
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}"
+        url = f"/repos/{owner}/{repo}/issues/{issue_number}"
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.patch(url, headers=self.headers, json={"state": "closed"})
-                resp.raise_for_status()
-                logger.info(f"Successfully closed issue #{issue_number} on GitHub")
-                return {"success": True, "error_type": None, "message": "Issue closed successfully"}
+            resp = self._request("PATCH", url, json={"state": "closed"})
+            resp.raise_for_status()
+            self.invalidate(owner, repo, issue_number)
+            self.invalidate_open_issues(owner, repo)
+            logger.info("Successfully closed issue #%s on GitHub", issue_number)
+            return {"success": True, "error_type": None, "message": "Issue closed successfully"}
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
-                logger.error(f"Permission denied to close issue #{issue_number}")
+                logger.error("Permission denied to close issue #%s", issue_number)
                 return {
                     "success": False, 
                     "error_type": "permission_denied",
                     "message": "Permission Denied. Your GitHub Token is read-only. Please generate a new token with 'repo' scope."
                 }
             elif e.response.status_code == 404:
-                logger.error(f"Issue #{issue_number} not found")
+                logger.error("Issue #%s not found", issue_number)
                 return {
                     "success": False,
                     "error_type": "not_found", 
                     "message": f"Issue #{issue_number} not found on GitHub."
                 }
             else:
-                logger.error(f"Failed to close issue #{issue_number}: {e}")
+                logger.error("Failed to close issue #%s: %s", issue_number, e)
                 return {
                     "success": False,
                     "error_type": "unknown",
                     "message": f"GitHub API error: {e.response.status_code}"
                 }
         except Exception as e:
-            logger.error(f"Failed to close issue #{issue_number}: {e}")
+            logger.error("Failed to close issue #%s: %s", issue_number, e)
             return {
                 "success": False,
                 "error_type": "unknown",
                 "message": f"Connection error: {str(e)}"
             }
 
+    def close_issues_bulk(self, owner: str, repo: str, numbers: List[int]) -> List[Dict[str, Any]]:
+        """
+        Close several issues side by side on the fan-out pool; the rate limiter
+        still gates (and backs off) every PATCH. Returns one close_issue result
+        per number, in order.
+        """
+        return list(self._pool.map(lambda number: self.close_issue(owner, repo, number), numbers))
+
+    @_hot_cached("pull", HOT_CACHE_TTL)
     def get_pull_request(self, owner: str, repo: str, pr_number: int) -> Optional[Dict[str, Any]]:
         """Fetch a specific pull request to check its status."""
-        url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}"
+        return self._fetch_pull_request(owner, repo, pr_number)
+
+    def _fetch_pull_request(self, owner: str, repo: str, pr_number: int) -> Optional[Dict[str, Any]]:
+        """get_pull_request without the hot cache; the ETag still makes an unchanged PR a 304."""
+        url = f"/repos/{owner}/{repo}/pulls/{pr_number}"
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.get(url, headers=self.headers)
-                if resp.status_code == 404:
-                    return None
-                resp.raise_for_status()
-                return resp.json()
+            resp, data = self._cached_get(url)
+            if resp.status_code == 404:
+                return None
+            resp.raise_for_status()
+            return data
         except Exception as e:
-            logger.error(f"Failed to fetch PR #{pr_number}: {e}")
+            logger.error("Failed to fetch PR #%s: %s", pr_number, e)
             return None
 
+    def get_pull_requests(self, owner: str, repo: str, pr_numbers: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several pull requests side by side on the fan-out pool, still
+        gated by the rate limiter. Returns get_pull_request() results in order.
+        """
+        return list(self._pool.map(lambda number: self.get_pull_request(owner, repo, number), pr_numbers))
+
+    @_hot_cached("ci", CI_CACHE_TTL, keep=lambda value: value.get("sha") is not None)
     def get_pr_ci_status(self, owner: str, repo: str, pr_number: int) -> Dict[str, Any]:
         """
         Fetch the combined CI status for a PR's latest commit.
@@ -144,7 +578,9 @@ class GitHubClient:
         }
         """
         try:
-            pr = self.get_pull_request(owner, repo, pr_number)
+            # Read the PR fresh: a hot-cached one could name a head SHA up to
+            # HOT_CACHE_TTL old, i.e. the commit before Devin's latest push
+            pr = self._fetch_pull_request(owner, repo, pr_number)
             if not pr:
                 return {"status": "unknown", "total_count": 0, "failures": [], "sha": None}
             
@@ -152,56 +588,20 @@ class GitHubClient:
             if not head_sha:
                 return {"status": "unknown", "total_count": 0, "failures": [], "sha": None}
             
-            with httpx.Client(timeout=self.timeout) as client:
-                status_url = f"{self.base_url}/repos/{owner}/{repo}/commits/{head_sha}/status"
-                resp = client.get(status_url, headers=self.headers)
-                resp.raise_for_status()
-                status_data = resp.json()
-                
-                checks_url = f"{self.base_url}/repos/{owner}/{repo}/commits/{head_sha}/check-runs"
-                checks_resp = client.get(checks_url, headers=self.headers)
-                checks_resp.raise_for_status()
-                checks_data = checks_resp.json()
+            # Both depend only on the SHA, so fetch them concurrently
+            status_future = self._pool.submit(self._get_json, f"/repos/{owner}/{repo}/commits/{head_sha}/status")
+            checks_data = self._get_json(f"/repos/{owner}/{repo}/commits/{head_sha}/check-runs")
+            status_data = status_future.result()
             
             combined_state = status_data.get("state", "unknown")
             statuses = status_data.get("statuses", [])
             check_runs = checks_data.get("check_runs", [])
             
-            failures = []
-            pending_count = 0
-            
-            for s in statuses:
-                if s.get("state") == "failure":
-                    failures.append({
-                        "name": s.get("context", "Unknown"),
-                        "description": s.get("description", "No description")
-                    })
-                elif s.get("state") == "pending":
-                    pending_count += 1
-            
-            for run in check_runs:
-                conclusion = run.get("conclusion")
-                status = run.get("status")
-                if conclusion == "failure" or conclusion == "cancelled":
-                    failures.append({
-                        "name": run.get("name", "Unknown"),
-                        "description": run.get("output", {}).get("summary", "Check failed")
-                    })
-                elif status == "in_progress" or status == "queued":
-                    pending_count += 1
-            
-            if failures:
-                final_status = "failing"
-            elif pending_count > 0:
-                final_status = "pending"
-            elif combined_state == "success" or (not statuses and not check_runs):
-                final_status = "passing"
-            else:
-                final_status = combined_state
+            final_status, failures = _summarize_ci(combined_state, statuses, check_runs)
             
             total_count = len(statuses) + len(check_runs)
             
-            logger.info(f"CI Status for PR #{pr_number}: {final_status} ({total_count} checks)")
+            logger.info("CI Status for PR #%s: %s (%d checks)", pr_number, final_status, total_count)
             return {
                 "status": final_status,
                 "total_count": total_count,
@@ -210,21 +610,18 @@ class GitHubClient:
             }
             
         except Exception as e:
-            logger.error(f"Failed to fetch CI status for PR #{pr_number}: {e}")
+            logger.error("Failed to fetch CI status for PR #%s: %s", pr_number, e)
             return {"status": "unknown", "total_count": 0, "failures": [], "sha": None}
 
     def get_check_run_logs(self, owner: str, repo: str, check_run_id: int) -> Optional[str]:
         """Fetch logs for a specific check run (if available)."""
-        url = f"{self.base_url}/repos/{owner}/{repo}/check-runs/{check_run_id}"
+        url = f"/repos/{owner}/{repo}/check-runs/{check_run_id}"
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.get(url, headers=self.headers)
-                resp.raise_for_status()
-                data = resp.json()
-                output = data.get("output", {})
-                return output.get("text") or output.get("summary") or "No logs available"
+            data = self._get_json(url)
+            output = data.get("output", {})
+            return output.get("text") or output.get("summary") or "No logs available"
         except Exception as e:
-            logger.error(f"Failed to fetch check run logs: {e}")
+            logger.error("Failed to fetch check run logs: %s", e)
             return None
 
     def create_issue(self, owner: str, repo: str, title: str, body: str) -> Dict[str, Any]:
@@ -233,23 +630,23 @@ class GitHubClient:
         Returns a dict with 'success', 'issue_number', and 'url' on success,
         or 'success': False and 'error' on failure.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+        url = f"/repos/{owner}/{repo}/issues"
         payload = {
             "title": title,
             "body": body
         }
         
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.post(url, headers=self.headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                logger.info(f"Created issue #{data.get('number')}: {title[:50]}...")
-                return {
-                    "success": True,
-                    "issue_number": data.get("number"),
-                    "url": data.get("html_url")
-                }
+            resp = self._request("POST", url, json=payload)
+            resp.raise_for_status()
+            data = _json(resp)
+            self.invalidate_open_issues(owner, repo)
+            logger.info("Created issue #%s: %.50s...", data.get("number"), title)
+            return {
+                "success": True,
+                "issue_number": data.get("number"),
+                "url": data.get("html_url")
+            }
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
                 return {
@@ -267,44 +664,152 @@ class GitHubClient:
                     "error": f"GitHub API error: {e.response.status_code}"
                 }
         except Exception as e:
-            logger.error(f"Failed to create issue: {e}")
+            logger.error("Failed to create issue: %s", e)
             return {
                 "success": False,
                 "error": f"Connection error: {str(e)}"
             }
 
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """POST one GraphQL document; short rate-limit windows are waited out."""
+        resp = self._request("POST", "/graphql", json={"query": query, "variables": variables})
+        resp.raise_for_status()
+        return _json(resp)
+
+    def create_issues(self, owner: str, repo: str, issues: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Create several issues with one GraphQL mutation per GRAPHQL_BATCH_SIZE rows
+        (one aliased createIssue each) instead of one REST call per issue.
+        Takes (title, body) pairs; returns one create_issue-style dict per pair, in order.
+        """
+        results: List[Dict[str, Any]] = []
+        try:
+            data = self._graphql(
+                "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { id } }",
+                {"owner": owner, "name": repo}
+            )
+            repo_id = ((data.get("data") or {}).get("repository") or {}).get("id")
+            if not repo_id:
+                error = f"Repository '{owner}/{repo}' not found."
+                return [{"success": False, "error": error} for _ in issues]
+
+            for start in range(0, len(issues), GRAPHQL_BATCH_SIZE):
+                batch = issues[start:start + GRAPHQL_BATCH_SIZE]
+                params = ["$repo: ID!"]
+                fields = []
+                variables: Dict[str, Any] = {"repo": repo_id}
+                for n, (title, body) in enumerate(batch):
+                    params += [f"$t{n}: String!", f"$b{n}: String!"]
+                    fields.append(
+                        f"i{n}: createIssue(input: {{repositoryId: $repo, title: $t{n}, body: $b{n}}}) "
+                        "{ issue { number url } }"
+                    )
+                    variables[f"t{n}"] = title
+                    variables[f"b{n}"] = body
+                mutation = f"mutation({', '.join(params)}) {{ {' '.join(fields)} }}"
+
+                data = self._graphql(mutation, variables)
+                self.invalidate_open_issues(owner, repo)
+                created = data.get("data") or {}
+                errors = {}
+                for err in data.get("errors") or []:
+                    path = err.get("path") or []
+                    if path:
+                        errors[path[0]] = err.get("message", "GraphQL error")
+                for n, (title, _) in enumerate(batch):
+                    issue = (created.get(f"i{n}") or {}).get("issue")
+                    if issue:
+                        logger.info("Created issue #%s: %.50s...", issue["number"], title)
+                        results.append({"success": True, "issue_number": issue["number"], "url": issue["url"]})
+                    else:
+                        results.append({"success": False, "error": errors.get(f"i{n}", "GitHub did not create the issue.")})
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                error = "Permission Denied. Your GitHub Token needs 'repo' scope to create issues."
+            else:
+                error = f"GitHub API error: {e.response.status_code}"
+            results += [{"success": False, "error": error}] * (len(issues) - len(results))
+        except Exception as e:
+            logger.error("Failed to create issues: %s", e)
+            results += [{"success": False, "error": f"Connection error: {str(e)}"}] * (len(issues) - len(results))
+        return results
+
     def fetch_open_issues(self, owner: str, repo: str) -> List[Dict[str, Any]]:
-        """Fetch all open issues for a repo (handles pagination)."""
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
-        params = {"state": "open", "per_page": 100}
+        """
+        Fetch all open issues for a repo. The listing is shared by every client
+        for OPEN_ISSUES_TTL seconds, so sync_repo_issues followed by
+        sync_pr_statuses pages through GitHub once; issues created or closed
+        through a client drop it early. Returns a fresh list each call.
+        """
+        key = (owner, repo)
+        with _open_issues_lock:
+            hit = _open_issues_cache.get(key)
+        if hit and hit[0] > time.monotonic():
+            logger.info("Reusing open issues for %s/%s fetched moments ago.", owner, repo)
+            return list(hit[1])
+
+        issues = self._list_open_issues(owner, repo)
+        with _open_issues_lock:
+            _open_issues_cache[key] = (time.monotonic() + OPEN_ISSUES_TTL, issues)
+        return list(issues)
+
+    def _collect_pages(self, url: str, params: Dict[str, Any], resp: httpx.Response, data: Any) -> List[Dict[str, Any]]:
+        """
+        Issues from page 1 (resp/data) and every later page. When page 1's Link
+        header names the last page, pages 2..N are fetched concurrently on the
+        fan-out pool; otherwise "next" is followed one hop at a time.
+        """
+        def issues_on(page) -> List[Dict[str, Any]]:
+            # The /issues listing returns PRs as issues too, so those are skipped
+            return [item for item in page if "pull_request" not in item]
+
+        links = _links(resp)
+        last_url = links.get("last")
+        last_page = int(httpx.URL(last_url).params.get("page", 1)) if last_url else 1
+        if last_page > 1:
+            pages = self._pool.map(
+                lambda page: self._get_json(url, params={**params, "page": page}),
+                range(2, last_page + 1)
+            )
+            issues = issues_on(data)
+            for page in pages:
+                issues += issues_on(page)
+            return issues
+
+        # No "last" link: follow "next" one hop at a time, requesting
+        # each page before filtering the one already in hand
         issues = []
-        
-        logger.info(f"Fetching issues for {owner}/{repo}...")
+        next_url = links.get("next")
+        while next_url:
+            future = self._pool.submit(self._cached_get, next_url)
+            issues += issues_on(data)
+            resp, data = future.result()
+            resp.raise_for_status()
+            next_url = _links(resp).get("next")
+        issues += issues_on(data)
+        return issues
+
+    def _list_open_issues(self, owner: str, repo: str) -> List[Dict[str, Any]]:
+        """
+        Fetch all open issues for a repo (handles pagination).
+        This listing drives stale-closing, so it comes from /issues rather
+        than the search API: the search index lags, and an issue opened
+        seconds ago can be missing even when total_count matches the pages.
+        Oldest first, so an issue opened while paging lands on the last page
+        instead of shifting the earlier ones.
+        """
+        logger.info("Fetching issues for %s/%s...", owner, repo)
         
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                while url:
-                    resp = client.get(url, headers=self.headers, params=params)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    
-                    if not data:
-                        break
-
-                    count_this_page = 0
-                    for item in data:
-                        # Skip Pull Requests (GitHub API returns PRs as issues too)
-                        if "pull_request" not in item:
-                            issues.append(item)
-                            count_this_page += 1
-                    
-                    # Handle pagination
-                    url = resp.links.get("next", {}).get("url")
-                    params = {} # params only needed for first page
-                    
-            logger.info(f"✓ Found {len(issues)} open issues.")
+            url = f"/repos/{owner}/{repo}/issues"
+            params = {"state": "open", "sort": "created", "direction": "asc", "per_page": 100}
+            resp, data = self._cached_get(url, params)
+            resp.raise_for_status()
+            issues = self._collect_pages(url, params, resp, data)
+
+            logger.info("✓ Found %d open issues.", len(issues))
             return issues
 
         except Exception as e:
-            logger.error(f"Error fetching issues: {e}")
+            logger.error("Error fetching issues: %s", e)
             raise e
@@ -1,14 +1,36 @@
 from datetime import datetime
+import threading
+import orjson
 from pathlib import Path
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON, ForeignKey, Index
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker, scoped_session
+from sqlalchemy import create_engine, event, case, and_, Column, Integer, String, Text, DateTime, LargeBinary, ForeignKey, Index
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import declarative_base, deferred, relationship, sessionmaker, scoped_session
+from sqlalchemy.types import TypeDecorator
 
 # 1. Setup Local DB Path
 DB_DIR = Path.home() / ".devin-sheriff"
 DB_FILE = f"sqlite:///{DB_DIR}/sheriff.db"
+# Stored in PRAGMA user_version once migrations and create_all() have run.
+# Bump it whenever a model or migrate_db() changes.
+SCHEMA_VERSION = 1
 
 Base = declarative_base()
 
+class OrJSON(TypeDecorator):
+    """
+    JSON stored as orjson bytes in a BLOB, skipping the str encode/decode
+    step of the generic JSON type. Rows written as TEXT by older versions
+    still load, since orjson.loads accepts str as well.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return orjson.dumps(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return orjson.loads(value) if value is not None else None
+
 # --- MODELS ---
 
 class Repo(Base):
@@ -31,17 +53,18 @@ class Issue(Base):
     __tablename__ = "issues"
     
     id = Column(Integer, primary_key=True)
-    repo_id = Column(Integer, ForeignKey("repos.id"), nullable=False, index=True)
+    repo_id = Column(Integer, ForeignKey("repos.id"), nullable=False)
     number = Column(Integer, nullable=False)
     title = Column(String, nullable=False)
     body = Column(Text, nullable=True)
-    state = Column(String, default="open", index=True) # open/closed
+    state = Column(String, default="open") # open/closed
     
     # Sheriff Status: NEW, SCOPED, EXECUTING, PR_OPEN, DONE, FAILED
-    status = Column(String, default="NEW", index=True) 
+    status = Column(String, default="NEW") 
     
     confidence = Column(Integer, nullable=True) # 0-100
-    scope_json = Column(JSON, nullable=True)
+    # Deferred: only the detail views need the plan, so other loads skip decoding it
+    scope_json = deferred(Column(OrJSON, nullable=True))
     pr_url = Column(String, nullable=True)
     last_error = Column(Text, nullable=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -55,6 +78,22 @@ class Issue(Base):
     # Cascade: If Issue is deleted, delete its session history
     sessions = relationship("DevinSession", back_populates="issue", cascade="all, delete-orphan")
 
+    # Every lookup is scoped to one repo, so repo_id leads each index;
+    # (repo_id, number) is also the issue's real identity on GitHub
+    __table_args__ = (
+        Index("ix_issue_repo_status", "repo_id", "status"),
+        Index("ix_issue_repo_state", "repo_id", "state"),
+        Index("ix_issue_repo_number", "repo_id", "number", unique=True),
+    )
+
+    @property
+    def display_label(self) -> str:
+        """Short '#N: title' label for queue entries, truncated to 30 chars."""
+        title = self.title or ""
+        if len(title) > 30:
+            return f"#{self.number}: {title[:30]}..."
+        return f"#{self.number}: {title}"
+
     def __repr__(self):
         return f"<Issue #{self.number} [{self.status}]>"
 
@@ -66,44 +105,134 @@ class DevinSession(Base):
     session_type = Column(String) # SCOPE or EXECUTE
     devin_session_id = Column(String, index=True)
     status = Column(String)
-    output_json = Column(JSON, nullable=True)
+    output_json = deferred(Column(OrJSON, nullable=True))  # loaded on first access
     created_at = Column(DateTime, default=datetime.utcnow)
 
     issue = relationship("Issue", back_populates="sessions")
 
+    __table_args__ = (Index("ix_devin_sessions_issue", "issue_id"),)
+
     def __repr__(self):
         return f"<Session {self.session_type} - {self.status}>"
 
+class HttpCache(Base):
+    """Conditional-request cache for GitHub GETs, so ETags survive restarts."""
+    __tablename__ = "http_cache"
+
+    url = Column(String, primary_key=True)  # full request URL including query
+    etag = Column(String, nullable=False)
+    link = Column(String, nullable=True)  # Link header, needed to keep paginating
+    body = Column(OrJSON, nullable=True)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (Index("ix_http_cache_fetched", "fetched_at"),)
+
+    def __repr__(self):
+        return f"<HttpCache {self.url}>"
+
+# --- BULK HELPERS ---
+
+def upsert_issues(session, repo_id: int, items) -> None:
+    """
+    Insert or refresh open GitHub issues (dicts as returned by fetch_open_issues)
+    with INSERT ... ON CONFLICT (repo_id, number) DO UPDATE, run as a single
+    executemany instead of a query and flush per issue. Existing rows take
+    GitHub's title/body and are re-opened; a DONE issue that reappears restarts
+    at NEW. Sheriff's own fields are left alone. The caller commits.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            "repo_id": repo_id,
+            "number": item["number"],
+            "title": item["title"],
+            "body": item.get("body") or "",
+            "state": "open",
+            "status": "NEW",
+            "updated_at": now,
+        }
+        for item in items
+    ]
+    if not rows:
+        return
+    # One statement with bound parameters: sqlite3 prepares it once and reuses
+    # it for every row, and no statement grows with the row count
+    stmt = sqlite_insert(Issue)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["repo_id", "number"],
+        set_={
+            "title": stmt.excluded.title,
+            "body": stmt.excluded.body,
+            "state": "open",
+            "status": case(
+                (and_(Issue.state == "closed", Issue.status == "DONE"), "NEW"),
+                else_=Issue.status,
+            ),
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    session.execute(stmt, rows)
+
 # --- DATABASE INITIALIZATION ---
 
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    WAL lets the dashboard read while background tasks write, and
+    synchronous=NORMAL skips the fsync on every commit (safe under WAL).
+    Temp tables live in memory, reads go through a 256 MB mmap instead of
+    read() copies, and each connection keeps a 64 MB page cache.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+_engine = None
+_schema_ready = False
+_init_lock = threading.RLock()
+
 def get_engine():
-    """Get or create the database engine."""
-    DB_DIR.mkdir(parents=True, exist_ok=True)
-    return create_engine(DB_FILE, connect_args={"check_same_thread": False})
+    """Get or create the process-wide database engine."""
+    global _engine
+    with _init_lock:
+        if _engine is None:
+            DB_DIR.mkdir(parents=True, exist_ok=True)
+            _engine = create_engine(DB_FILE, connect_args={"check_same_thread": False})
+            event.listen(_engine, "connect", _set_sqlite_pragmas)
+        return _engine
 
 def migrate_db(engine):
     """
     Run database migrations to add new columns to existing tables.
     This handles upgrading existing databases without requiring Factory Reset.
+    Returns True when every migration applied; raises if the index migrations fail.
     """
     import sqlite3
     import logging
     
     db_path = DB_DIR / "sheriff.db"
     if not db_path.exists():
-        return
+        return True
     
     conn = sqlite3.connect(str(db_path))
     cursor = conn.cursor()
     
     cursor.execute("PRAGMA table_info(issues)")
     existing_columns = {row[1] for row in cursor.fetchall()}
+    if not existing_columns:
+        # Empty database: create_all() builds the current schema
+        conn.close()
+        return True
     
     migrations = [
         ("retry_count", "ALTER TABLE issues ADD COLUMN retry_count INTEGER DEFAULT 0"),
         ("ci_status", "ALTER TABLE issues ADD COLUMN ci_status TEXT"),
     ]
     
+    ok = True
     for column_name, sql in migrations:
         if column_name not in existing_columns:
             try:
@@ -111,29 +240,118 @@ def migrate_db(engine):
                 logging.info(f"Migration: Added column '{column_name}' to issues table")
             except sqlite3.OperationalError as e:
                 logging.warning(f"Migration warning for '{column_name}': {e}")
+                ok = False
+    
+    # Older syncs had no uniqueness on (repo_id, number) and could leave
+    # duplicate rows, which would block the unique index upsert_issues()
+    # relies on. Keep one row per issue, preferring the one carrying Sheriff
+    # state (plan, PR, non-NEW status), then the oldest; its duplicates'
+    # session history is moved onto it.
+    dedupe = [
+        """CREATE TEMP TABLE issue_dupes AS
+           SELECT id, keep_id FROM (
+               SELECT id, FIRST_VALUE(id) OVER (
+                   PARTITION BY repo_id, number
+                   ORDER BY CASE WHEN status != 'NEW' OR scope_json IS NOT NULL
+                                   OR pr_url IS NOT NULL THEN 0 ELSE 1 END, id
+               ) AS keep_id
+               FROM issues
+           ) WHERE id != keep_id""",
+        """UPDATE devin_sessions
+           SET issue_id = (SELECT keep_id FROM issue_dupes WHERE issue_dupes.id = devin_sessions.issue_id)
+           WHERE issue_id IN (SELECT id FROM issue_dupes)""",
+        "DELETE FROM issues WHERE id IN (SELECT id FROM issue_dupes)",
+        "DROP TABLE issue_dupes",
+    ]
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'devin_sessions'")
+    if not cursor.fetchone():
+        del dedupe[1]
+
+    # create_all() only creates missing tables, so index changes on existing
+    # tables are applied here. The single-column indexes are superseded by
+    # the composite ones.
+    index_migrations = dedupe + [
+        "DROP INDEX IF EXISTS ix_issues_repo_id",
+        "DROP INDEX IF EXISTS ix_issues_state",
+        "DROP INDEX IF EXISTS ix_issues_status",
+        "CREATE INDEX IF NOT EXISTS ix_issue_repo_status ON issues (repo_id, status)",
+        "CREATE INDEX IF NOT EXISTS ix_issue_repo_state ON issues (repo_id, state)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_issue_repo_number ON issues (repo_id, number)",
+        "CREATE INDEX IF NOT EXISTS ix_devin_sessions_issue ON devin_sessions (issue_id)",
+    ]
     
+    # All or nothing: a half-applied index migration would leave a database
+    # the upsert can't use, so roll back and raise. init_db() then leaves
+    # the schema version unstamped and the next start retries.
     conn.commit()
-    conn.close()
+    try:
+        cursor.execute("BEGIN")
+        for sql in index_migrations:
+            cursor.execute(sql)
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        raise RuntimeError(
+            f"Database migration failed ({e}). Back up {db_path} and run a Factory Reset if this persists."
+        ) from e
+    finally:
+        conn.close()
+    
+    logging.info("Migration: issue indexes are up to date")
+    return ok
 
 def init_db():
-    """Creates tables if they don't exist and returns a session factory."""
-    engine = get_engine()
-    migrate_db(engine)
-    Base.metadata.create_all(engine)
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    """
+    Creates tables if they don't exist and returns the session factory.
+    Runs once per process, on the first session rather than at import, and a
+    database already stamped with SCHEMA_VERSION skips migrations and
+    create_all() entirely. The version is only stamped once every migration
+    has applied, so a failed or partial one is retried on the next start.
+    """
+    global _schema_ready
+    with _init_lock:
+        if not _schema_ready:
+            engine = get_engine()
+            with engine.connect() as conn:
+                version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+            if version != SCHEMA_VERSION:
+                migrated = migrate_db(engine)
+                Base.metadata.create_all(engine)
+                if migrated:
+                    with engine.begin() as conn:
+                        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            SessionFactory.configure(bind=engine)
+            _schema_ready = True
+    return SessionFactory
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that runs init_db() before handing out the first session."""
+
+    def __call__(self, **local_kw):
+        if not _schema_ready:
+            init_db()
+        return super().__call__(**local_kw)
 
 def reset_database():
     """
     Factory reset: Drop all tables and recreate them.
     Returns True on success, False on failure.
     """
+    global _schema_ready
     try:
-        db_path = DB_DIR / "sheriff.db"
-        if db_path.exists():
-            db_path.unlink()
-        
-        global SessionLocal
-        SessionLocal = init_db()
+        with _init_lock:
+            # Release pooled connections before deleting the files underneath them
+            SessionLocal.remove()
+            get_engine().dispose()
+            
+            db_path = DB_DIR / "sheriff.db"
+            for path in (db_path, db_path.with_name("sheriff.db-wal"), db_path.with_name("sheriff.db-shm")):
+                if path.exists():
+                    path.unlink()
+            
+            # The engine opens the new file on its next connection
+            _schema_ready = False
+            init_db()
         return True
     except Exception as e:
         import logging
@@ -144,5 +362,11 @@ def get_db_path() -> Path:
     """Return the path to the database file."""
     return DB_DIR / "sheriff.db"
 
-# Create a global Session Factory
-SessionLocal = init_db()
+# Create a global Session Factory. SessionLocal hands each thread its own
+# session; call SessionLocal.remove() when a unit of work is finished.
+# Sessions keep loaded attributes after commit (expire_on_commit=False), so
+# reading an object you just saved doesn't trigger another SELECT. Sessions
+# are short-lived, so fresh data comes from the next session.
+# Nothing touches the database until the first session is created.
+SessionFactory = _LazySessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+SessionLocal = scoped_session(SessionFactory)
@@ -1,25 +1,60 @@
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
-from .models import SessionLocal, Repo, Issue
+from .models import SessionFactory, Repo, Issue, upsert_issues
 from .github_client import GitHubClient
-from .config import load_config
+from .config import get_cached_config
 
 # --- LOGGING SETUP ---
 logger = logging.getLogger("sync")
 logging.basicConfig(level=logging.INFO)
 
+# owner/name from a GitHub URL; a trailing ".git" or path is left out of the name
+GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/|$)")
+PR_NUMBER_RE = re.compile(r"/pull/(\d+)")
+
+# Both syncs look the repo up by URL. Built once, so each call only binds the
+# url instead of constructing a Query, and the compiled SQL is reused.
+_REPO_BY_URL = select(Repo).where(Repo.url == bindparam("url"))
+# The open numbers go in as one expanding parameter, so the statement text is
+# stable and SQLite takes the set difference; an empty list closes every issue.
+# Both syncs read issues as column rows, so there are no loaded Issue objects
+# to refresh afterwards.
+_CLOSE_STALE = (
+    update(Issue)
+    .where(
+        Issue.repo_id == bindparam("rid"),
+        Issue.state == "open",
+        Issue.number.notin_(bindparam("open_numbers", expanding=True)),
+    )
+    .values(state="closed", status="DONE")  # Update UI status
+    .execution_options(synchronize_session=False)
+)
+
 
 def extract_pr_number_from_url(pr_url: str) -> Optional[int]:
     """Extract PR number from a GitHub PR URL."""
     if not pr_url:
         return None
-    match = re.search(r"/pull/(\d+)", pr_url)
+    match = PR_NUMBER_RE.search(pr_url)
     if match:
         return int(match.group(1))
     return None
 
+def _close_stale_issues(db: Session, repo_id: int, open_numbers) -> int:
+    """
+    Mark the repo's local open issues that aren't in open_numbers (the open
+    issues on GitHub) as closed/DONE. One UPDATE lets SQLite take the set
+    difference instead of diffing rows in Python. Returns how many were closed.
+    """
+    result = db.execute(_CLOSE_STALE, {"rid": repo_id, "open_numbers": list(open_numbers)})
+    if result.rowcount:
+        logger.info(f"✔ Closed {result.rowcount} issues (Not found in open list)")
+    return result.rowcount
+
 def sync_repo_issues(repo_url: str) -> str:
     """
     Full Sync Logic:
@@ -32,24 +67,23 @@ def sync_repo_issues(repo_url: str) -> str:
     """
     
     # 1. Setup & Configuration Check
-    config = load_config()
+    config = get_cached_config()
     if not config.github_token:
         logger.error("Sync failed: No GitHub Token found.")
         return "Configuration Error: No GitHub Token found. Please run 'python main.py setup' to configure your credentials."
 
     # 2. Parse URL
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
+    match = GITHUB_URL_RE.search(repo_url)
     if not match:
         return "Invalid URL: The repository URL must be in the format 'https://github.com/owner/repo'. Please check the URL and try again."
     
     owner, repo_name = match.groups()
-    repo_name = repo_name.replace(".git", "").rstrip("/")
 
     # 3. Fetch Data from GitHub
     logger.info(f"Syncing {owner}/{repo_name}...")
     try:
-        gh = GitHubClient(config)
-        gh_issues = gh.fetch_open_issues(owner, repo_name)
+        with GitHubClient(config) as gh:
+            gh_issues = gh.fetch_open_issues(owner, repo_name)
     except Exception as e:
         error_msg = str(e)
         logger.error(f"GitHub API Error: {error_msg}")
@@ -69,88 +103,58 @@ def sync_repo_issues(repo_url: str) -> str:
             return f"GitHub Error: {error_msg}"
 
     # 4. Database Operations
-    db: Session = SessionLocal()
+    # One explicit transaction: a single BEGIN/COMMIT for the lookup, upsert
+    # and stale close, rolled back if anything raises
     try:
-        # Find Repo in DB
-        repo = db.query(Repo).filter_by(url=repo_url).first()
-        if not repo:
-            return "Error: Repo not connected locally. Run 'connect' first."
-
-        # Track stats
-        open_numbers = set()
-        stats = {"new": 0, "updated": 0, "closed": 0, "skipped": 0}
-
-        # --- PROCESS OPEN ISSUES FROM GITHUB ---
-        for i_data in gh_issues:
-            num = i_data["number"]
-            title = i_data["title"]
-            body = i_data.get("body", "") or ""
-            
-            open_numbers.add(num)
-            
-            # Check if issue exists locally
-            issue = db.query(Issue).filter_by(repo_id=repo.id, number=num).first()
-            
-            if not issue:
-                # CREATE NEW
-                new_issue = Issue(
-                    repo_id=repo.id,
-                    number=num,
-                    title=title,
-                    body=body,
-                    state="open",
-                    status="NEW"
-                )
-                db.add(new_issue)
-                stats["new"] += 1
-                logger.info(f"➕ Added #{num}: {title[:30]}...")
-            else:
-                # UPDATE EXISTING
-                # Check for changes to minimize DB writes
-                needs_update = False
+        with SessionFactory() as db, db.begin():
+            # Find Repo in DB
+            repo = db.execute(_REPO_BY_URL, {"url": repo_url}).scalar_one_or_none()
+            if not repo:
+                return "Error: Repo not connected locally. Run 'connect' first."
+
+            # Track stats
+            open_numbers = set()
+            stats = {"new": 0, "updated": 0, "closed": 0, "skipped": 0}
+
+            # --- PROCESS OPEN ISSUES FROM GITHUB ---
+            # One read of the repo's issues to classify the GitHub list, then one
+            # upsert for everything new or changed
+            local = {
+                row.number: row
+                for row in db.query(Issue.number, Issue.state, Issue.title, Issue.body).filter(Issue.repo_id == repo.id)
+            }
+            changed = []
+            for i_data in gh_issues:
+                num = i_data["number"]
+                title = i_data["title"]
+                body = i_data.get("body", "") or ""
                 
-                # 1. Re-open if it was closed
-                if issue.state == "closed":
-                    issue.state = "open"
-                    if issue.status == "DONE":
-                        issue.status = "NEW" # Reset flow if re-opened
-                    needs_update = True
-                    stats["updated"] += 1
+                open_numbers.add(num)
                 
-                # 2. Update content if changed
-                if issue.title != title or issue.body != body:
-                    issue.title = title
-                    issue.body = body
-                    if not needs_update:  # Only count if not already counted from state change
-                        stats["updated"] += 1
-                    needs_update = True
-                
-                if not needs_update:
+                issue = local.get(num)
+                if issue is None:
+                    stats["new"] += 1
+                    logger.info(f"➕ Added #{num}: {title[:30]}...")
+                elif issue.state == "closed" or issue.title != title or issue.body != body:
+                    # Re-opened on GitHub, or content changed
+                    stats["updated"] += 1
+                else:
                     stats["skipped"] += 1
+                    continue
+                changed.append(i_data)
+            
+            upsert_issues(db, repo.id, changed)
+
+            # --- CLOSE STALE ISSUES ---
+            stats["closed"] = _close_stale_issues(db, repo.id, open_numbers)
 
-        # --- CLOSE STALE ISSUES ---
-        # Any local issue that is 'open' but NOT in the fetch list is considered closed on GitHub.
-        local_open_issues = db.query(Issue).filter(Issue.repo_id == repo.id, Issue.state == "open").all()
-        
-        for local_issue in local_open_issues:
-            if local_issue.number not in open_numbers:
-                local_issue.state = "closed"
-                local_issue.status = "DONE" # Update UI status
-                stats["closed"] += 1
-                logger.info(f"✔ Closed #{local_issue.number} (Not found in open list)")
-
-        db.commit()
-        
         summary = f"Synced: {stats['new']} new, {stats['updated']} updated, {stats['closed']} closed."
         logger.info(summary)
         return summary
 
     except Exception as e:
-        db.rollback()
         logger.error(f"Database Sync Error: {e}")
         return f"Database Error: {e}"
-    finally:
-        db.close()
 
 
 def sync_pr_statuses(repo_url: str) -> Dict[str, Any]:
@@ -159,75 +163,78 @@ def sync_pr_statuses(repo_url: str) -> Dict[str, Any]:
     Returns detailed stats about what was updated.
     Provides user-friendly error messages for common failure scenarios.
     """
-    config = load_config()
+    config = get_cached_config()
     if not config.github_token:
         return {"error": "Configuration Error: No GitHub Token found. Please run 'python main.py setup' to configure your credentials.", "stats": {}}
 
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
+    match = GITHUB_URL_RE.search(repo_url)
     if not match:
         return {"error": "Invalid URL: The repository URL must be in the format 'https://github.com/owner/repo'.", "stats": {}}
     
     owner, repo_name = match.groups()
-    repo_name = repo_name.replace(".git", "")
 
-    db: Session = SessionLocal()
     stats = {"issues_updated": 0, "prs_checked": 0, "prs_merged": 0, "prs_closed": 0}
     
     try:
-        gh = GitHubClient(config)
-        repo = db.query(Repo).filter_by(url=repo_url).first()
-        if not repo:
-            return {"error": "Repo not connected locally", "stats": stats}
-
-        issues_with_prs = db.query(Issue).filter(
-            Issue.repo_id == repo.id,
-            Issue.pr_url.isnot(None),
-            Issue.status == "PR_OPEN"
-        ).all()
-
-        for issue in issues_with_prs:
-            pr_number = extract_pr_number_from_url(issue.pr_url)
-            if not pr_number:
-                continue
-            
-            stats["prs_checked"] += 1
-            pr_data = gh.get_pull_request(owner, repo_name, pr_number)
-            
-            if pr_data:
-                pr_state = pr_data.get("state", "")
-                merged = pr_data.get("merged", False)
+        with GitHubClient(config) as gh, SessionFactory() as db:
+            # Read in its own short transaction, so no SQLite snapshot is held
+            # while GitHub is being asked about each PR
+            with db.begin():
+                repo = db.execute(_REPO_BY_URL, {"url": repo_url}).scalar_one_or_none()
+                if not repo:
+                    return {"error": "Repo not connected locally", "stats": stats}
+
+                # The stale pass is a single UPDATE, so only PR-linked issues are read,
+                # and only the columns used here (not the body/plan blobs)
+                issues_with_prs = db.query(Issue.id, Issue.number, Issue.pr_url).filter(
+                    Issue.repo_id == repo.id,
+                    Issue.pr_url.isnot(None),
+                    Issue.status == "PR_OPEN"
+                ).all()
+            # Issues whose PR merged, by primary key; written in one executemany at
+            # the end instead of dirtying each instance for a per-row flush
+            merged_rows = []
+
+            # The open-issue listing doesn't depend on the PR lookups, so it runs
+            # alongside them; DB changes are then applied here, in order
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync") as ex:
+                open_future = ex.submit(gh.fetch_open_issues, owner, repo_name)
+
+                checked = []
+                for issue in issues_with_prs:
+                    pr_number = extract_pr_number_from_url(issue.pr_url)
+                    if pr_number:
+                        checked.append((issue, pr_number))
+                pr_results = gh.get_pull_requests(owner, repo_name, [pr_number for _, pr_number in checked])
                 
-                if merged:
-                    issue.status = "DONE"
-                    issue.state = "closed"
-                    stats["prs_merged"] += 1
-                    stats["issues_updated"] += 1
-                    logger.info(f"PR #{pr_number} merged - Issue #{issue.number} marked DONE")
-                elif pr_state == "closed":
-                    stats["prs_closed"] += 1
-                    logger.info(f"PR #{pr_number} closed without merge")
-
-        gh_issues = gh.fetch_open_issues(owner, repo_name)
-        open_numbers = {i["number"] for i in gh_issues}
-        
-        local_open_issues = db.query(Issue).filter(
-            Issue.repo_id == repo.id,
-            Issue.state == "open"
-        ).all()
-        
-        for local_issue in local_open_issues:
-            if local_issue.number not in open_numbers:
-                local_issue.state = "closed"
-                local_issue.status = "DONE"
-                stats["issues_updated"] += 1
-                logger.info(f"Issue #{local_issue.number} closed on GitHub - marked DONE")
-
-        db.commit()
+                for (issue, pr_number), pr_data in zip(checked, pr_results):
+                    stats["prs_checked"] += 1
+                    if not pr_data:
+                        continue
+                    
+                    pr_state = pr_data.get("state", "")
+                    merged = pr_data.get("merged", False)
+                    
+                    if merged:
+                        merged_rows.append({"id": issue.id, "status": "DONE", "state": "closed"})
+                        stats["prs_merged"] += 1
+                        stats["issues_updated"] += 1
+                        logger.info(f"PR #{pr_number} merged - Issue #{issue.number} marked DONE")
+                    elif pr_state == "closed":
+                        stats["prs_closed"] += 1
+                        logger.info(f"PR #{pr_number} closed without merge")
+
+                gh_issues = open_future.result()
+            open_numbers = {i["number"] for i in gh_issues}
+            
+            # Both writes commit together, or roll back together on error.
+            # Merged first, so the stale pass (open rows only) doesn't count them again
+            with db.begin():
+                db.bulk_update_mappings(Issue, merged_rows)
+                stats["issues_updated"] += _close_stale_issues(db, repo.id, open_numbers)
+
         return {"error": None, "stats": stats}
 
     except Exception as e:
-        db.rollback()
         logger.error(f"PR Sync Error: {e}")
         return {"error": str(e), "stats": stats}
-    finally:
-        db.close()
@@ -1,11 +1,56 @@
 import httpx
+import atexit
+import functools
 import logging
-from typing import Optional
-from .config import load_config
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from .config import get_cached_config
 
 logger = logging.getLogger("utils")
 logging.basicConfig(level=logging.INFO)
 
+# One keep-alive client for every webhook post, so a burst of notifications
+# (scope complete, then PR opened) reuses the TLS connection instead of
+# handshaking with Slack/Discord each time.
+_WEBHOOK_CLIENT = httpx.Client(
+    timeout=10.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+)
+atexit.register(_WEBHOOK_CLIENT.close)
+# Notifications are posted off the caller's thread. A single worker keeps them
+# in order, and pending posts still drain at interpreter exit.
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify")
+
+EMOJI_MAP = {
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "error": "❌"
+}
+
+def _discord_payload(message: str, formatted_message: str) -> Dict[str, Any]:
+    return {"content": formatted_message}
+
+def _slack_payload(message: str, formatted_message: str) -> Dict[str, Any]:
+    return {"text": formatted_message.replace("**", "*")}
+
+def _generic_payload(message: str, formatted_message: str) -> Dict[str, Any]:
+    return {"text": message, "message": message, "content": formatted_message}
+
+@functools.lru_cache(maxsize=4)
+def _payload_builder(webhook_url: str) -> Callable[[str, str], Dict[str, Any]]:
+    """
+    Pick the payload shape for a webhook URL. Keyed on the URL, so the
+    Discord/Slack sniffing runs once per configured URL, not once per send.
+    """
+    webhook_url = webhook_url.lower()
+    if "discord" in webhook_url:
+        return _discord_payload
+    elif "slack" in webhook_url:
+        return _slack_payload
+    return _generic_payload
+
 def send_notification(message: str, level: str = "info") -> bool:
     """
     Send a notification to the configured webhook URL (Slack/Discord).
@@ -17,38 +62,21 @@ def send_notification(message: str, level: str = "info") -> bool:
     Returns:
         True if notification was sent successfully, False otherwise
     """
-    config = load_config()
+    config = get_cached_config()
     
     if not config.webhook_url:
         logger.debug("No webhook URL configured, skipping notification")
         return False
     
-    emoji_map = {
-        "info": "ℹ️",
-        "success": "✅",
-        "warning": "⚠️",
-        "error": "❌"
-    }
-    emoji = emoji_map.get(level, "📢")
-    
+    emoji = EMOJI_MAP.get(level, "📢")
     formatted_message = f"{emoji} **Devin Sheriff** | {message}"
-    
-    payload = {}
-    webhook_url = config.webhook_url.lower()
-    
-    if "discord" in webhook_url:
-        payload = {"content": formatted_message}
-    elif "slack" in webhook_url or "hooks.slack.com" in webhook_url:
-        payload = {"text": formatted_message.replace("**", "*")}
-    else:
-        payload = {"text": message, "message": message, "content": formatted_message}
+    payload = _payload_builder(config.webhook_url)(message, formatted_message)
     
     try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.post(config.webhook_url, json=payload)
-            resp.raise_for_status()
-            logger.info(f"Notification sent: {message[:50]}...")
-            return True
+        resp = _WEBHOOK_CLIENT.post(config.webhook_url, json=payload)
+        resp.raise_for_status()
+        logger.info(f"Notification sent: {message[:50]}...")
+        return True
     except httpx.HTTPStatusError as e:
         logger.error(f"Webhook HTTP error: {e.response.status_code}")
         return False
@@ -57,22 +85,31 @@ def send_notification(message: str, level: str = "info") -> bool:
         return False
 
 
+def send_notification_async(message: str, level: str = "info") -> Future:
+    """
+    Queue send_notification() on the background notifier and return at once,
+    so a slow webhook never holds up a sync or a UI action.
+    The returned Future resolves to send_notification()'s bool.
+    """
+    return _NOTIFY_POOL.submit(send_notification, message, level)
+
+
 def notify_scope_complete(issue_number: int, title: str, confidence: int):
     """Send notification when a Scope session completes."""
     message = f"Scope Complete for Issue #{issue_number}: {title[:50]}... (Confidence: {confidence}%)"
-    return send_notification(message, level="success")
+    return send_notification_async(message, level="success")
 
 
 def notify_pr_opened(issue_number: int, title: str, pr_url: str):
     """Send notification when a PR is opened."""
     message = f"PR Opened for Issue #{issue_number}: {title[:50]}... | {pr_url}"
-    return send_notification(message, level="success")
+    return send_notification_async(message, level="success")
 
 
 def notify_auto_heal_triggered(issue_number: int, retry_count: int):
     """Send notification when Auto-Healer triggers."""
     message = f"Auto-Healer triggered for Issue #{issue_number} (Retry {retry_count}/3)"
-    return send_notification(message, level="warning")
+    return send_notification_async(message, level="warning")
 
 
 def test_webhook() -> dict:
@@ -80,7 +117,7 @@ def test_webhook() -> dict:
     Test the webhook configuration by sending a test message.
     Returns a dict with 'success' and 'message' keys.
     """
-    config = load_config()
+    config = get_cached_config()
     
     if not config.webhook_url:
         return {